@@ -1,7 +1,7 @@
 """CLI command to create a new review project."""
 import click
 import json
-from database.connection import get_database_connection
+from database.connection import open_database
 from database.queries import ReviewDatabase
 
 @click.command()
@@ -16,7 +16,7 @@ def create_review(name, question, reviewers, criteria, ai, db_path):
     # Parse reviewers
     reviewer_list = [r.strip() for r in reviewers.split(',')]
 
-    # Parse criteria
+    # Parse criteria; create_review serializes it once when storing
     if criteria:
         try:
             criteria_dict = json.loads(criteria)
@@ -26,19 +26,17 @@ def create_review(name, question, reviewers, criteria, ai, db_path):
     else:
         criteria_dict = {}
 
-    # Create review
-    conn = get_database_connection(db_path)
-    review_db = ReviewDatabase(conn)
+    # Create review (shared connection stays open for later commands)
+    with open_database(db_path) as conn:
+        review_db = ReviewDatabase(conn)
 
-    review_id = review_db.create_review(
-        review_name=name,
-        research_question=question,
-        inclusion_criteria_json=json.dumps(criteria_dict),
-        reviewers_json=json.dumps(reviewer_list),
-        use_ai_suggestions=ai
-    )
-
-    conn.close()
+        review_id = review_db.create_review(
+            review_name=name,
+            research_question=question,
+            inclusion_criteria_json=criteria_dict,
+            reviewers_json=reviewer_list,
+            use_ai_suggestions=ai
+        )
 
     # Output success
     click.echo(f"✓ Created review project: {review_id}")
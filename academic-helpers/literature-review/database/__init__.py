@@ -1,4 +1,4 @@
 """Literature review database package."""
-from .connection import get_database_connection
+from .connection import get_database_connection, get_shared_connection, open_database
 
-__all__ = ['get_database_connection']
+__all__ = ['get_database_connection', 'get_shared_connection', 'open_database']
@@ -1,6 +1,36 @@
 """Database connection management."""
+import atexit
 import sqlite3
 import os
+from contextlib import contextmanager
+
+# Process-wide connections keyed by resolved database path
+_shared_connections = {}
+
+_SCHEMA_PATH = os.path.join(os.path.dirname(__file__), 'schema.sql')
+_SCHEMA_SQL = None  # schema.sql text, read once per process
+
+def _load_schema():
+    """Read schema.sql on first use and return the cached text."""
+    global _SCHEMA_SQL
+    if _SCHEMA_SQL is None and os.path.exists(_SCHEMA_PATH):
+        with open(_SCHEMA_PATH, 'r') as f:
+            _SCHEMA_SQL = f.read()
+    return _SCHEMA_SQL
+
+def _resolve_db_path(db_path=None):
+    """Resolve db_path to the default database or an absolute file path."""
+    if db_path is None:
+        db_path = os.path.join(
+            os.path.dirname(__file__),
+            '..',
+            'literature_review.db'
+        )
+
+    if db_path == ':memory:':
+        return db_path
+
+    return os.path.abspath(db_path)
 
 def get_database_connection(db_path=None):
     """
@@ -13,20 +43,89 @@ def get_database_connection(db_path=None):
     Returns:
         sqlite3.Connection
     """
-    if db_path is None:
-        db_path = os.path.join(
-            os.path.dirname(__file__),
-            '..',
-            'literature_review.db'
-        )
+    db_path = _resolve_db_path(db_path)
 
-    conn = sqlite3.connect(db_path)
+    # Larger statement cache keeps hot insert/query plans prepared
+    conn = sqlite3.connect(db_path, cached_statements=256)
     conn.row_factory = sqlite3.Row  # Enable column access by name
 
     # Initialize schema
-    schema_path = os.path.join(os.path.dirname(__file__), 'schema.sql')
-    if os.path.exists(schema_path):
-        with open(schema_path, 'r') as f:
-            conn.executescript(f.read())
+    schema_sql = _load_schema()
+    if schema_sql:
+        conn.executescript(schema_sql)
+
+    _apply_pragmas(conn, db_path)
+
+    return conn
+
+def _apply_pragmas(conn, db_path):
+    """Configure journaling, caching and memory mapping for throughput."""
+    pragmas = [
+        "PRAGMA cache_size=-65536",  # 64 MB page cache
+        "PRAGMA temp_store=MEMORY",
+    ]
+    if db_path != ':memory:':
+        pragmas += [
+            "PRAGMA journal_mode=WAL",
+            "PRAGMA synchronous=NORMAL",
+            "PRAGMA mmap_size=268435456",  # 256 MB
+        ]
+
+    for pragma in pragmas:
+        try:
+            conn.execute(pragma)
+        except sqlite3.OperationalError:
+            # e.g. WAL unavailable on read-only filesystems; keep defaults
+            pass
+
+def get_shared_connection(db_path=None):
+    """
+    Get the process-wide connection for a database, opening it on first use.
+
+    Successive calls with the same path reuse one connection instead of
+    reopening the database file. Connections are closed at interpreter exit.
+
+    Args:
+        db_path: Path to database file. If None, uses default.
+
+    Returns:
+        sqlite3.Connection
+    """
+    db_path = _resolve_db_path(db_path)
+
+    conn = _shared_connections.get(db_path)
+    if conn is None:
+        conn = get_database_connection(db_path)
+        _shared_connections[db_path] = conn
 
     return conn
+
+@contextmanager
+def open_database(db_path=None):
+    """
+    Use the shared connection for a database within a transaction.
+
+    Commits on success and rolls back on error, but leaves the
+    connection open for later callers.
+
+    Args:
+        db_path: Path to database file. If None, uses default.
+
+    Yields:
+        sqlite3.Connection
+    """
+    conn = get_shared_connection(db_path)
+    with conn:
+        yield conn
+
+@atexit.register
+def close_shared_connections():
+    """Close all process-wide connections."""
+    while _shared_connections:
+        _, conn = _shared_connections.popitem()
+        try:
+            # Refresh planner statistics once, as SQLite recommends at close
+            conn.execute("PRAGMA optimize")
+        except sqlite3.Error:
+            pass
+        conn.close()
@@ -1,8 +1,91 @@
 # database/queries.py
 """Database query layer for literature review."""
+import json
 import sqlite3
+from contextlib import contextmanager
+from dataclasses import dataclass
 from datetime import datetime
-from typing import List, Dict, Optional, Any
+from typing import Iterable, Iterator, List, Dict, Optional, Any, Tuple, Union
+
+@dataclass(slots=True)
+class ScreeningRow:
+    """A screening decision row from paper_screening."""
+    screening_id: int
+    review_id: int
+    paper_id: str
+    reviewer_id: str
+    stage: str
+    decision: str
+    rationale: Optional[str]
+    timestamp: str
+
+# Insert statements shared by single-row and bulk methods so SQLite's
+# statement cache reuses one prepared statement per table
+INSERT_SCREENING_SQL = """
+    INSERT INTO paper_screening (
+        review_id,
+        paper_id,
+        reviewer_id,
+        stage,
+        decision,
+        rationale
+    ) VALUES (?, ?, ?, ?, ?, ?)
+"""
+
+INSERT_EXTRACTION_SQL = """
+    INSERT INTO paper_extraction (
+        review_id,
+        paper_id,
+        reviewer_id,
+        template_name,
+        extracted_data_json
+    ) VALUES (?, ?, ?, ?, ?)
+"""
+
+# CTE pairing the first and second screening decision (by timestamp) of
+# papers in a review screened exactly twice at a stage.
+# Parameters: (review_id, stage, review_id)
+DUAL_SCREENED_PAIRS_SQL = """
+    WITH ranked AS (
+        SELECT
+            paper_id,
+            reviewer_id,
+            decision,
+            ROW_NUMBER() OVER (
+                PARTITION BY paper_id ORDER BY timestamp, screening_id
+            ) AS position,
+            COUNT(*) OVER (PARTITION BY paper_id) AS decision_count
+        FROM paper_screening
+        WHERE review_id = ? AND stage = ?
+    ),
+    pairs AS (
+        SELECT
+            r1.paper_id,
+            r1.reviewer_id AS reviewer1,
+            r2.reviewer_id AS reviewer2,
+            r1.decision AS decision1,
+            r2.decision AS decision2,
+            rp.date_added
+        FROM ranked r1
+        JOIN ranked r2
+            ON r2.paper_id = r1.paper_id AND r2.position = 2
+        JOIN review_papers rp
+            ON rp.review_id = ? AND rp.paper_id = r1.paper_id
+        WHERE r1.position = 1 AND r1.decision_count = 2
+    )
+"""
+
+# Papers screened by both of two named reviewers; named params
+# :review_id, :stage, :reviewer_a, :reviewer_b
+REVIEWER_PAIR_SQL = """
+    FROM paper_screening a
+    JOIN paper_screening b
+        ON b.review_id = a.review_id
+        AND b.paper_id = a.paper_id
+        AND b.stage = a.stage
+        AND b.reviewer_id = :reviewer_b
+    WHERE a.review_id = :review_id AND a.stage = :stage AND a.reviewer_id = :reviewer_a
+"""
 
 class ReviewDatabase:
     """Database operations for literature reviews."""
@@ -15,22 +98,57 @@ class ReviewDatabase:
             connection: SQLite connection
         """
         self.conn = connection
+        self._transaction_depth = 0  # open transaction() blocks
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """
+        Context manager wrapping writes in one transaction.
+
+        Insert methods do not commit on their own; group them with
+        ``with review_db.transaction():`` to commit once on success
+        (or roll back on error). Nested blocks, and blocks entered while
+        the connection already has a transaction open, join the outer
+        transaction instead of committing it early.
+        """
+        if self._transaction_depth or self.conn.in_transaction:
+            self._transaction_depth += 1
+            try:
+                yield self.conn
+            finally:
+                self._transaction_depth -= 1
+            return
+
+        self._transaction_depth = 1
+        try:
+            with self.conn:
+                yield self.conn
+        finally:
+            self._transaction_depth = 0
 
     def create_review(
         self,
         review_name: str,
         research_question: str,
-        inclusion_criteria_json: str,
-        reviewers_json: str,
+        inclusion_criteria_json: Union[Dict[str, Any], str],
+        reviewers_json: Union[List[str], str],
         search_strategy: Optional[str] = None,
         use_ai_suggestions: bool = True
     ) -> int:
         """
         Create a new review project.
 
+        Criteria and reviewers may be passed as Python objects, which are
+        serialized once here; JSON strings are stored unchanged.
+
         Returns:
             review_id of created review
         """
+        if not isinstance(inclusion_criteria_json, str):
+            inclusion_criteria_json = json.dumps(inclusion_criteria_json, separators=(',', ':'))
+        if not isinstance(reviewers_json, str):
+            reviewers_json = json.dumps(reviewers_json, separators=(',', ':'))
+
         cursor = self.conn.cursor()
         cursor.execute("""
             INSERT INTO reviews (
@@ -49,7 +167,6 @@ class ReviewDatabase:
             search_strategy,
             use_ai_suggestions
         ))
-        self.conn.commit()
         return cursor.lastrowid
 
     def get_review(self, review_id: int) -> Optional[Dict[str, Any]]:
@@ -72,7 +189,6 @@ class ReviewDatabase:
             INSERT OR IGNORE INTO review_papers (review_id, paper_id)
             VALUES (?, ?)
         """, (review_id, paper_id))
-        self.conn.commit()
 
     def get_review_papers(self, review_id: int) -> List[str]:
         """Get all paper IDs linked to this review."""
@@ -83,7 +199,7 @@ class ReviewDatabase:
             ORDER BY date_added
         """, (review_id,))
 
-        return [row[0] for row in cursor.fetchall()]
+        return [row[0] for row in cursor]
 
     def insert_screening(
         self,
@@ -96,34 +212,177 @@ class ReviewDatabase:
     ) -> int:
         """Record a screening decision."""
         cursor = self.conn.cursor()
-        cursor.execute("""
-            INSERT INTO paper_screening (
-                review_id,
-                paper_id,
-                reviewer_id,
-                stage,
-                decision,
-                rationale
-            ) VALUES (?, ?, ?, ?, ?, ?)
-        """, (review_id, paper_id, reviewer_id, stage, decision, rationale))
-        self.conn.commit()
+        cursor.execute(
+            INSERT_SCREENING_SQL,
+            (review_id, paper_id, reviewer_id, stage, decision, rationale)
+        )
         return cursor.lastrowid
 
+    def insert_screening_many(
+        self,
+        rows: Iterable[Tuple[int, str, str, str, str, Optional[str]]]
+    ) -> int:
+        """
+        Record many screening decisions in a single transaction.
+
+        Args:
+            rows: Tuples of (review_id, paper_id, reviewer_id, stage,
+                  decision, rationale)
+
+        Returns:
+            Number of decisions inserted
+        """
+        with self.transaction():
+            cursor = self.conn.executemany(INSERT_SCREENING_SQL, rows)
+        return cursor.rowcount
+
     def get_screening_decisions(
         self,
         review_id: int,
         paper_id: str,
         stage: str
-    ) -> List[Dict[str, Any]]:
+    ) -> List[ScreeningRow]:
         """Get all screening decisions for a paper at a stage."""
         cursor = self.conn.cursor()
         cursor.execute("""
-            SELECT * FROM paper_screening
+            SELECT
+                screening_id,
+                review_id,
+                paper_id,
+                reviewer_id,
+                stage,
+                decision,
+                rationale,
+                timestamp
+            FROM paper_screening
             WHERE review_id = ? AND paper_id = ? AND stage = ?
             ORDER BY timestamp
         """, (review_id, paper_id, stage))
 
-        return [dict(row) for row in cursor.fetchall()]
+        return [ScreeningRow(*row) for row in cursor]
+
+    def get_unscreened_papers(
+        self,
+        review_id: int,
+        reviewer_id: str,
+        stage: str
+    ) -> List[str]:
+        """Get paper IDs in this review not yet screened by reviewer at stage."""
+        cursor = self.conn.cursor()
+        cursor.execute("""
+            SELECT rp.paper_id FROM review_papers rp
+            LEFT JOIN paper_screening ps
+                ON ps.review_id = rp.review_id
+                AND ps.paper_id = rp.paper_id
+                AND ps.reviewer_id = ?
+                AND ps.stage = ?
+            WHERE rp.review_id = ? AND ps.screening_id IS NULL
+            ORDER BY rp.date_added
+        """, (reviewer_id, stage, review_id))
+
+        return [row[0] for row in cursor]
+
+    def get_dual_screened_pairs(
+        self,
+        review_id: int,
+        stage: str,
+        disagreements_only: bool = False
+    ) -> List[Dict[str, Any]]:
+        """
+        Get papers screened by exactly two reviewers at a stage.
+
+        Each row pairs the first and second decision (by timestamp) as
+        reviewer1/decision1 and reviewer2/decision2.
+        """
+        condition = "WHERE decision1 != decision2" if disagreements_only else ""
+
+        cursor = self.conn.cursor()
+        cursor.execute(DUAL_SCREENED_PAIRS_SQL + f"""
+            SELECT paper_id, reviewer1, reviewer2, decision1, decision2
+            FROM pairs
+            {condition}
+            ORDER BY date_added
+        """, (review_id, stage, review_id))
+
+        return [dict(row) for row in cursor]
+
+    def get_screening_contingency(
+        self,
+        review_id: int,
+        stage: str
+    ) -> List[Dict[str, Any]]:
+        """
+        Count dual-screened papers per (decision1, decision2) combination.
+
+        Returns:
+            Rows with decision1, decision2 and pair_count
+        """
+        cursor = self.conn.cursor()
+        cursor.execute(DUAL_SCREENED_PAIRS_SQL + """
+            SELECT decision1, decision2, COUNT(*) AS pair_count
+            FROM pairs
+            GROUP BY decision1, decision2
+        """, (review_id, stage, review_id))
+
+        return [dict(row) for row in cursor]
+
+    def get_reviewer_pair_contingency(
+        self,
+        review_id: int,
+        stage: str,
+        reviewer_a: str,
+        reviewer_b: str
+    ) -> List[Dict[str, Any]]:
+        """
+        Count papers screened by both reviewers per decision combination.
+
+        Returns:
+            Rows with decision1 (reviewer_a), decision2 (reviewer_b)
+            and pair_count
+        """
+        cursor = self.conn.cursor()
+        cursor.execute("""
+            SELECT a.decision AS decision1, b.decision AS decision2,
+                   COUNT(*) AS pair_count
+        """ + REVIEWER_PAIR_SQL + """
+            GROUP BY a.decision, b.decision
+        """, {
+            'review_id': review_id,
+            'stage': stage,
+            'reviewer_a': reviewer_a,
+            'reviewer_b': reviewer_b
+        })
+
+        return [dict(row) for row in cursor]
+
+    def get_reviewer_pair_disagreements(
+        self,
+        review_id: int,
+        stage: str,
+        reviewer_a: str,
+        reviewer_b: str
+    ) -> List[Dict[str, Any]]:
+        """
+        Get papers on which two reviewers made different decisions.
+
+        Rows have the same keys as get_dual_screened_pairs.
+        """
+        cursor = self.conn.cursor()
+        cursor.execute("""
+            SELECT a.paper_id, a.reviewer_id AS reviewer1,
+                   b.reviewer_id AS reviewer2,
+                   a.decision AS decision1, b.decision AS decision2
+        """ + REVIEWER_PAIR_SQL + """
+                AND a.decision != b.decision
+            ORDER BY a.timestamp, a.screening_id
+        """, {
+            'review_id': review_id,
+            'stage': stage,
+            'reviewer_a': reviewer_a,
+            'reviewer_b': reviewer_b
+        })
+
+        return [dict(row) for row in cursor]
 
     def insert_extraction(
         self,
@@ -135,18 +394,30 @@ class ReviewDatabase:
     ) -> int:
         """Save extraction data."""
         cursor = self.conn.cursor()
-        cursor.execute("""
-            INSERT INTO paper_extraction (
-                review_id,
-                paper_id,
-                reviewer_id,
-                template_name,
-                extracted_data_json
-            ) VALUES (?, ?, ?, ?, ?)
-        """, (review_id, paper_id, reviewer_id, template_name, extracted_data_json))
-        self.conn.commit()
+        cursor.execute(
+            INSERT_EXTRACTION_SQL,
+            (review_id, paper_id, reviewer_id, template_name, extracted_data_json)
+        )
         return cursor.lastrowid
 
+    def insert_extraction_many(
+        self,
+        rows: Iterable[Tuple[int, str, str, str, str]]
+    ) -> int:
+        """
+        Save many extractions in a single transaction.
+
+        Args:
+            rows: Tuples of (review_id, paper_id, reviewer_id,
+                  template_name, extracted_data_json)
+
+        Returns:
+            Number of extractions inserted
+        """
+        with self.transaction():
+            cursor = self.conn.executemany(INSERT_EXTRACTION_SQL, rows)
+        return cursor.rowcount
+
     def get_extractions(
         self,
         review_id: int,
@@ -160,7 +431,44 @@ class ReviewDatabase:
             ORDER BY timestamp
         """, (review_id, paper_id))
 
-        return [dict(row) for row in cursor.fetchall()]
+        return [dict(row) for row in cursor]
+
+    def get_review_extractions_with_field(
+        self,
+        review_id: int,
+        field_name: str
+    ) -> List[Dict[str, Any]]:
+        """Get all extractions for papers in a review that contain a field."""
+        cursor = self.conn.cursor()
+
+        # SQLite JSON paths can't escape quotes or backslashes in a key, so
+        # such names are matched in Python instead of spliced into the path.
+        # Payloads SQLite rejects (json.dumps writes NaN/Infinity) go the
+        # same way rather than failing the whole query.
+        match_in_sql = '"' not in field_name and '\\' not in field_name
+        cursor.execute("""
+            SELECT pe.*, json_valid(pe.extracted_data_json) AS json_ok
+            FROM paper_extraction pe
+            JOIN review_papers rp
+                ON rp.review_id = pe.review_id AND rp.paper_id = pe.paper_id
+            WHERE pe.review_id = ?
+                AND CASE WHEN ? AND json_valid(pe.extracted_data_json)
+                    THEN json_type(pe.extracted_data_json, '$."' || ? || '"') IS NOT NULL
+                    ELSE 1 END
+            ORDER BY rp.date_added, pe.timestamp
+        """, (review_id, match_in_sql, field_name))
+
+        extractions = []
+        for row in cursor:
+            extraction = dict(row)
+            json_ok = extraction.pop('json_ok')
+            if not (match_in_sql and json_ok):
+                data = json.loads(extraction['extracted_data_json'])
+                if not isinstance(data, dict) or field_name not in data:
+                    continue
+            extractions.append(extraction)
+
+        return extractions
 
     def insert_theme(
         self,
@@ -181,7 +489,6 @@ class ReviewDatabase:
                 created_by
             ) VALUES (?, ?, ?, ?, ?)
         """, (review_id, theme_name, theme_description, parent_theme_id, created_by))
-        self.conn.commit()
         return cursor.lastrowid
 
     def get_themes(self, review_id: int) -> List[Dict[str, Any]]:
@@ -193,4 +500,4 @@ class ReviewDatabase:
             ORDER BY timestamp
         """, (review_id,))
 
-        return [dict(row) for row in cursor.fetchall()]
+        return [dict(row) for row in cursor]
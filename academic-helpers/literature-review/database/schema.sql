@@ -122,6 +122,13 @@ CREATE TABLE IF NOT EXISTS reliability_metrics (
     calculated_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
 
+-- Indexes for performance
+CREATE INDEX IF NOT EXISTS idx_review_papers_added ON review_papers(review_id, date_added);
+CREATE INDEX IF NOT EXISTS idx_screening_review_paper_stage ON paper_screening(review_id, paper_id, stage, timestamp);
+CREATE INDEX IF NOT EXISTS idx_screening_review_reviewer_stage ON paper_screening(review_id, reviewer_id, stage);
+CREATE INDEX IF NOT EXISTS idx_extraction_review_paper ON paper_extraction(review_id, paper_id, timestamp);
+CREATE INDEX IF NOT EXISTS idx_themes_review ON themes(review_id, timestamp);
+
 -- Quality assurance view
 CREATE VIEW IF NOT EXISTS reliability_summary AS
 SELECT
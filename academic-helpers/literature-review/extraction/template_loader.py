@@ -1,8 +1,21 @@
 # extraction/template_loader.py
 """YAML template loader for data extraction."""
+import copy
 import os
+from functools import lru_cache
 import yaml
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional, Tuple
+
+try:
+    from yaml import CSafeLoader as _Loader  # libyaml-backed parser
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
+@lru_cache(maxsize=32)
+def _parse_template(template_path: str, mtime_ns: int) -> Dict[str, Any]:
+    """Parse a template file once per (path, st_mtime_ns); edits force a re-parse."""
+    with open(template_path, 'rb') as f:
+        return yaml.load(f, Loader=_Loader)
 
 class TemplateLoader:
     """Load and manage extraction templates."""
@@ -23,7 +36,8 @@ class TemplateLoader:
             )
 
         self.templates_dir = templates_dir
-        self._templates_cache = {}
+        # (directory st_mtime_ns, sorted template names)
+        self._listing_cache: Optional[Tuple[int, List[str]]] = None
 
     def load_template(self, template_name: str) -> Dict[str, Any]:
         """
@@ -38,27 +52,20 @@ class TemplateLoader:
         Raises:
             FileNotFoundError: If template does not exist
         """
-        # Check cache first
-        if template_name in self._templates_cache:
-            return self._templates_cache[template_name]
-
-        # Load from file
-        template_path = os.path.join(
+        template_path = os.path.abspath(os.path.join(
             self.templates_dir,
             f'{template_name}.yaml'
-        )
-
-        if not os.path.exists(template_path):
+        ))
+
+        # Parse shared across loader instances, keyed by absolute path and
+        # mtime; callers get their own copy so edits can't leak into the cache
+        try:
+            mtime_ns = os.stat(template_path).st_mtime_ns
+            return copy.deepcopy(_parse_template(template_path, mtime_ns))
+        except FileNotFoundError:
             raise FileNotFoundError(
                 f"Template '{template_name}' not found at {template_path}"
-            )
-
-        with open(template_path, 'r') as f:
-            template = yaml.safe_load(f)
-
-        # Cache and return
-        self._templates_cache[template_name] = template
-        return template
+            ) from None
 
     def list_templates(self) -> List[str]:
         """
@@ -67,15 +74,24 @@ class TemplateLoader:
         Returns:
             List of template names (without .yaml extension)
         """
-        if not os.path.exists(self.templates_dir):
+        try:
+            mtime_ns = os.stat(self.templates_dir).st_mtime_ns
+        except FileNotFoundError:
             return []
 
-        templates = []
-        for filename in os.listdir(self.templates_dir):
-            if filename.endswith('.yaml'):
-                templates.append(filename[:-5])  # Remove .yaml extension
+        # Reuse listing until the directory changes
+        if self._listing_cache is not None and self._listing_cache[0] == mtime_ns:
+            return list(self._listing_cache[1])
+
+        with os.scandir(self.templates_dir) as entries:
+            templates = sorted(
+                entry.name[:-5]  # Remove .yaml extension
+                for entry in entries
+                if entry.name.endswith('.yaml')
+            )
 
-        return sorted(templates)
+        self._listing_cache = (mtime_ns, templates)
+        return list(templates)
 
     def validate_template(self, template: Dict[str, Any]) -> List[str]:
         """
@@ -1,11 +1,12 @@
 """Inter-rater reliability calculation."""
-from typing import Dict, List, Any
+from bisect import bisect_right
+from typing import Dict, List, Any, Optional, Tuple
+import numpy as np
 from database.queries import ReviewDatabase
 
-try:
-    from sklearn.metrics import cohen_kappa_score
-except ImportError:
-    cohen_kappa_score = None
+# Landis & Koch scale: KAPPA_LABELS[i] covers kappa below KAPPA_THRESHOLDS[i]
+KAPPA_THRESHOLDS = (0.0, 0.20, 0.40, 0.60, 0.80)
+KAPPA_LABELS = ('Poor', 'Slight', 'Fair', 'Moderate', 'Substantial', 'Almost Perfect')
 
 class ReliabilityCalculator:
     """Calculate inter-rater reliability metrics."""
@@ -22,7 +23,9 @@ class ReliabilityCalculator:
     def calculate_screening_kappa(
         self,
         review_id: int,
-        stage: str
+        stage: str,
+        include_disagreements: bool = False,
+        reviewers: Optional[Tuple[str, str]] = None
     ) -> Dict[str, Any]:
         """
         Calculate Cohen's kappa for screening decisions.
@@ -30,81 +33,100 @@ class ReliabilityCalculator:
         Args:
             review_id: Review ID
             stage: Screening stage
+            include_disagreements: Also return the disagreeing paper pairs
+            reviewers: Compare these two reviewers on every paper both
+                       screened (default: the first two decisions on
+                       papers screened exactly twice)
 
         Returns:
             Dictionary with kappa, interpretation, agreements
+            (and disagreements if requested)
         """
-        if cohen_kappa_score is None:
-            raise ImportError("scikit-learn required for kappa calculation")
-
-        # Get all papers in review
-        papers = self.review_db.get_review_papers(review_id)
-
-        # Find papers screened by exactly 2 reviewers
-        agreements = []
-        for paper_id in papers:
-            decisions = self.review_db.get_screening_decisions(
+        # Contingency counts of decision pairs, built in SQL
+        if reviewers is not None:
+            contingency = self.review_db.get_reviewer_pair_contingency(
                 review_id,
-                paper_id,
-                stage
+                stage,
+                *reviewers
             )
+        else:
+            contingency = self.review_db.get_screening_contingency(review_id, stage)
 
-            if len(decisions) == 2:
-                agreements.append({
-                    'paper_id': paper_id,
-                    'reviewer1': decisions[0]['reviewer_id'],
-                    'reviewer2': decisions[1]['reviewer_id'],
-                    'decision1': decisions[0]['decision'],
-                    'decision2': decisions[1]['decision'],
-                    'agree': decisions[0]['decision'] == decisions[1]['decision']
-                })
-
-        if not agreements:
+        if not contingency:
             return {'error': 'No dual-screened papers found'}
 
-        # Calculate Cohen's kappa
-        labels1 = [a['decision1'] for a in agreements]
-        labels2 = [a['decision2'] for a in agreements]
-        kappa = cohen_kappa_score(labels1, labels2)
+        kappa, total_papers, agree_count = self._cohens_kappa(contingency)
 
         # Interpret (Landis & Koch)
-        if kappa < 0:
-            interpretation = 'Poor'
-        elif kappa < 0.20:
-            interpretation = 'Slight'
-        elif kappa < 0.40:
-            interpretation = 'Fair'
-        elif kappa < 0.60:
-            interpretation = 'Moderate'
-        elif kappa < 0.80:
-            interpretation = 'Substantial'
-        else:
-            interpretation = 'Almost Perfect'
+        interpretation = self._interpret_kappa(kappa)
 
         # Calculate percent agreement
-        agree_count = sum(a['agree'] for a in agreements)
-        percent_agreement = (agree_count / len(agreements)) * 100
+        percent_agreement = (agree_count / total_papers) * 100
 
-        return {
+        result = {
             'kappa': kappa,
             'interpretation': interpretation,
-            'total_papers': len(agreements),
+            'total_papers': total_papers,
             'agreements': agree_count,
-            'percent_agreement': percent_agreement,
-            'disagreements': [a for a in agreements if not a['agree']]
+            'percent_agreement': percent_agreement
         }
 
+        # Disagreeing pairs are only fetched row by row when asked for
+        if include_disagreements:
+            if reviewers is not None:
+                disagreements = self.review_db.get_reviewer_pair_disagreements(
+                    review_id,
+                    stage,
+                    *reviewers
+                )
+            else:
+                disagreements = self.review_db.get_dual_screened_pairs(
+                    review_id,
+                    stage,
+                    disagreements_only=True
+                )
+            for pair in disagreements:
+                pair['agree'] = False
+            result['disagreements'] = disagreements
+
+        return result
+
+    @staticmethod
+    def _cohens_kappa(contingency: List[Dict[str, Any]]) -> Tuple[float, int, int]:
+        """
+        Compute Cohen's kappa from (decision1, decision2, pair_count) rows.
+
+        Returns:
+            Tuple of (kappa, total pairs, agreeing pairs)
+        """
+        # Perfect agreement (incl. a single shared label): kappa is 1
+        if all(row['decision1'] == row['decision2'] for row in contingency):
+            total = sum(row['pair_count'] for row in contingency)
+            return 1.0, total, total
+
+        pair_count = len(contingency)
+        decisions = [row['decision1'] for row in contingency]
+        decisions += [row['decision2'] for row in contingency]
+        counts = np.fromiter(
+            (row['pair_count'] for row in contingency),
+            dtype=np.int64,
+            count=pair_count
+        )
+
+        # Encode labels as ints, then scatter counts into a k x k matrix
+        labels, codes = np.unique(decisions, return_inverse=True)
+        matrix = np.zeros((len(labels), len(labels)), dtype=np.int64)
+        np.add.at(matrix, (codes[:pair_count], codes[pair_count:]), counts)
+
+        # Closed form: (p_o - p_e) / (1 - p_e); p_e < 1 once any pair disagrees
+        total = matrix.sum()
+        agreed = np.trace(matrix)
+        observed = agreed / total
+        expected = (matrix.sum(axis=1) @ matrix.sum(axis=0)) / total ** 2
+        kappa = float((observed - expected) / (1 - expected))
+
+        return kappa, int(total), int(agreed)
+
     def _interpret_kappa(self, kappa: float) -> str:
         """Interpret kappa value using Landis & Koch scale."""
-        if kappa < 0:
-            return 'Poor'
-        elif kappa < 0.20:
-            return 'Slight'
-        elif kappa < 0.40:
-            return 'Fair'
-        elif kappa < 0.60:
-            return 'Moderate'
-        elif kappa < 0.80:
-            return 'Substantial'
-        else:
-            return 'Almost Perfect'
+        return KAPPA_LABELS[bisect_right(KAPPA_THRESHOLDS, kappa)]
@@ -1,6 +1,6 @@
 # screening/interface.py
 """Screening interface for literature review."""
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, List, Any
 from database.queries import ReviewDatabase
 
 class ScreeningInterface:
@@ -48,17 +48,53 @@ class ScreeningInterface:
             )
 
         # Record decision
-        screening_id = self.review_db.insert_screening(
-            review_id=review_id,
-            paper_id=paper_id,
-            reviewer_id=reviewer_id,
-            stage=stage,
-            decision=decision,
-            rationale=rationale
-        )
+        with self.review_db.transaction():
+            screening_id = self.review_db.insert_screening(
+                review_id=review_id,
+                paper_id=paper_id,
+                reviewer_id=reviewer_id,
+                stage=stage,
+                decision=decision,
+                rationale=rationale
+            )
 
         return screening_id
 
+    def record_decisions_batch(self, decisions: List[Dict[str, Any]]) -> int:
+        """
+        Record many screening decisions in a single transaction.
+
+        Args:
+            decisions: Dictionaries with review_id, paper_id, reviewer_id,
+                       stage, decision and optional rationale
+
+        Returns:
+            Number of decisions recorded
+
+        Raises:
+            ValueError: If any exclude decision lacks rationale (nothing
+                        is recorded in that case)
+        """
+        # Validate everything before writing anything
+        for d in decisions:
+            if d['decision'] == 'exclude' and not d.get('rationale'):
+                raise ValueError(
+                    f"Exclude decision for paper '{d['paper_id']}' requires "
+                    "rationale referencing inclusion criteria"
+                )
+
+        return self.review_db.insert_screening_many(
+            (
+                d['review_id'],
+                d['paper_id'],
+                d['reviewer_id'],
+                d['stage'],
+                d['decision'],
+                d.get('rationale')
+            )
+            for d in decisions
+        )
+
     def get_papers_needing_screening(
         self,
         review_id: int,
@@ -76,25 +112,9 @@ class ScreeningInterface:
         Returns:
             List of paper IDs needing screening
         """
-        # Get all papers in review
-        all_papers = self.review_db.get_review_papers(review_id)
-
-        # Filter to papers not yet screened by this reviewer
-        needing_screening = []
-        for paper_id in all_papers:
-            decisions = self.review_db.get_screening_decisions(
-                review_id,
-                paper_id,
-                stage
-            )
-
-            # Check if this reviewer has already screened
-            reviewer_screened = any(
-                d['reviewer_id'] == reviewer_id
-                for d in decisions
-            )
-
-            if not reviewer_screened:
-                needing_screening.append(paper_id)
-
-        return needing_screening
+        # Single query: papers in review without a decision from this reviewer
+        return self.review_db.get_unscreened_papers(
+            review_id,
+            reviewer_id,
+            stage
+        )
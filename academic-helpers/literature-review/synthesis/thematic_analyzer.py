@@ -1,11 +1,59 @@
 # synthesis/thematic_analyzer.py
 """AI-assisted thematic synthesis."""
+import importlib.util
 import json
+import math
+from functools import lru_cache
 from typing import Dict, List, Any, Optional
 from collections import Counter
 import re
 from database.queries import ReviewDatabase
 
+try:
+    import orjson  # Faster decoding when installed
+except ImportError:
+    orjson = None
+
+DEFAULT_EMBEDDING_MODEL = 'all-MiniLM-L6-v2'
+COSINE_EPS = 0.5  # Max cosine distance between neighbouring findings
+PRECOMPUTED_MAX_FINDINGS = 2000  # Largest N clustered from a dense N x N matrix
+
+# Keyword tokens: runs of 4+ lowercase ASCII letters
+_WORD_RE = re.compile(r'[a-z]{4,}')
+
+# Common words too generic to name a theme
+STOPWORDS = frozenset({
+    'about', 'after', 'also', 'among', 'been', 'before', 'being',
+    'between', 'both', 'could', 'does', 'each', 'from', 'have', 'into',
+    'more', 'most', 'only', 'other', 'over', 'same', 'should', 'some',
+    'such', 'than', 'that', 'their', 'them', 'then', 'there', 'these',
+    'they', 'this', 'those', 'through', 'very', 'were', 'what', 'when',
+    'where', 'which', 'while', 'will', 'with', 'within', 'would',
+})
+
+def _json_loads(data):
+    """Decode with orjson when available, falling back to json for NaN/Infinity."""
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+@lru_cache(maxsize=2)
+def _get_embedder(model_name: str = DEFAULT_EMBEDDING_MODEL):
+    """Load a SentenceTransformer once per process and reuse it."""
+    from sentence_transformers import SentenceTransformer
+    return SentenceTransformer(model_name)
+
+@lru_cache(maxsize=1)
+def _ai_deps_available() -> bool:
+    """Probe for the AI packages once per process, without importing them."""
+    return all(
+        importlib.util.find_spec(name) is not None
+        for name in ('sentence_transformers', 'sklearn')
+    )
+
 class ThematicSynthesizer:
     """Thematic synthesis with optional AI assistance."""
 
@@ -20,26 +68,31 @@ class ThematicSynthesizer:
         self.review_db = review_db
         self.use_ai = use_ai
 
-        if use_ai:
+        # AI dependencies are loaded on first suggest_themes call
+        self.embedder = None
+        self.DBSCAN = None
+
+    def _ensure_ai(self) -> bool:
+        """
+        Import AI dependencies and load the embedder on first use.
+
+        Returns:
+            True if AI suggestions are available
+        """
+        if self.use_ai and self.embedder is None:
             try:
-                from sentence_transformers import SentenceTransformer
                 from sklearn.cluster import DBSCAN
-                self.embedder = SentenceTransformer('all-MiniLM-L6-v2')
+                self.embedder = _get_embedder(DEFAULT_EMBEDDING_MODEL)
                 self.DBSCAN = DBSCAN
             except ImportError:
                 self.use_ai = False
-                self.embedder = None
-                self.DBSCAN = None
+
+        return self.use_ai
 
     @staticmethod
     def _check_ai_dependencies() -> bool:
         """Check if AI dependencies are available."""
-        try:
-            import sentence_transformers
-            import sklearn
-            return True
-        except ImportError:
-            return False
+        return _ai_deps_available()
 
     def suggest_themes(
         self,
@@ -59,7 +112,7 @@ class ThematicSynthesizer:
         # Get all extractions for this review
         extractions = self._get_all_extractions_field(review_id, field_name)
 
-        if not self.use_ai or self.embedder is None:
+        if not self._ensure_ai():
             # Manual mode - return raw data
             return {
                 'mode': 'manual',
@@ -71,8 +124,7 @@ class ThematicSynthesizer:
         paper_ids = []
 
         for extraction in extractions:
-            data = json.loads(extraction['extracted_data_json'])
-            value = data.get(field_name)
+            value = extraction['extracted_data'].get(field_name)
 
             if isinstance(value, list):
                 for item in value:
@@ -89,12 +141,38 @@ class ThematicSynthesizer:
                 'note': 'No text to cluster'
             }
 
-        # Embed all findings
-        embeddings = self.embedder.encode(texts)
+        # Embed all findings as unit vectors in batches
+        embeddings = self.embedder.encode(
+            texts,
+            batch_size=64,
+            normalize_embeddings=True,
+            convert_to_numpy=True,
+            show_progress_bar=False
+        )
 
         # Cluster similar findings
-        clusterer = self.DBSCAN(eps=0.5, min_samples=2, metric='cosine')
-        clusters = clusterer.fit_predict(embeddings)
+        if len(texts) <= PRECOMPUTED_MAX_FINDINGS:
+            import numpy as np  # Only the AI path needs numpy
+
+            # One matrix product gives all pairwise cosine distances
+            distances = 1.0 - embeddings @ embeddings.T
+            np.clip(distances, 0.0, 2.0, out=distances)
+            clusterer = self.DBSCAN(
+                eps=COSINE_EPS,
+                min_samples=2,
+                metric='precomputed'
+            )
+            clusters = clusterer.fit_predict(distances)
+        else:
+            # Too large for a dense matrix. For unit vectors
+            # ||a-b||^2 = 2(1 - cos), so this eps matches COSINE_EPS
+            clusterer = self.DBSCAN(
+                eps=math.sqrt(2 * COSINE_EPS),
+                min_samples=2,
+                metric='euclidean',
+                n_jobs=-1
+            )
+            clusters = clusterer.fit_predict(embeddings)
 
         # Generate theme suggestions
         suggested_themes = []
@@ -110,11 +188,14 @@ class ThematicSynthesizer:
             # Extract keywords for theme name
             theme_name = self._extract_keywords(cluster_texts)
 
+            # Dedupe papers, keeping first-seen order
+            unique_papers = list(dict.fromkeys(cluster_papers))
+
             suggested_themes.append({
                 'suggested_name': theme_name,
                 'example_quotes': cluster_texts[:5],
-                'paper_ids': list(set(cluster_papers)),
-                'paper_count': len(set(cluster_papers)),
+                'paper_ids': unique_papers,
+                'paper_count': len(unique_papers),
                 'finding_count': len(cluster_texts)
             })
 
@@ -134,33 +215,36 @@ class ThematicSynthesizer:
         review_id: int,
         field_name: str
     ) -> List[Dict[str, Any]]:
-        """Get all extractions with specified field."""
-        # Get all papers in review
-        papers = self.review_db.get_review_papers(review_id)
+        """
+        Get all extractions with specified field.
 
-        extractions = []
-        for paper_id in papers:
-            paper_extractions = self.review_db.get_extractions(review_id, paper_id)
+        Rows are filtered in SQL; each row's JSON payload is decoded once
+        and attached as 'extracted_data'.
+        """
+        extractions = self.review_db.get_review_extractions_with_field(
+            review_id,
+            field_name
+        )
 
-            for extraction in paper_extractions:
-                data = json.loads(extraction['extracted_data_json'])
-                if field_name in data:
-                    extractions.append(extraction)
+        for extraction in extractions:
+            extraction['extracted_data'] = _json_loads(
+                extraction['extracted_data_json']
+            )
 
         return extractions
 
     def _extract_keywords(self, texts: List[str]) -> str:
         """Extract common keywords from cluster texts."""
-        # Tokenize and count words
-        words = []
+        # Tokenize and count words, skipping stop words
+        counts = Counter()
         for text in texts:
-            # Remove punctuation, lowercase, split
-            tokens = re.findall(r'\b[a-z]{4,}\b', text.lower())
-            words.extend(tokens)
+            counts.update(
+                word for word in _WORD_RE.findall(text.lower())
+                if word not in STOPWORDS
+            )
 
         # Get most common words
-        common_words = Counter(words).most_common(3)
+        common_words = counts.most_common(3)
 
         # Create theme name
-        theme_name = ' + '.join(word for word, count in common_words)
-        return theme_name.title()
+        return ' + '.join(word.title() for word, count in common_words)
@@ -1,4 +1,5 @@
 import pytest
+import json
 from click.testing import CliRunner
 from cli.create_review import create_review
 from database.connection import get_database_connection
@@ -34,3 +35,39 @@ def test_create_review_no_ai():
 
         assert result.exit_code == 0
         assert 'Created review project' in result.output
+
+def test_create_review_stores_criteria(tmp_path):
+    """Test criteria JSON and reviewers are stored on the review."""
+    runner = CliRunner()
+    db_path = str(tmp_path / 'review.db')
+
+    result = runner.invoke(create_review, [
+        '--name', 'Criteria Review',
+        '--question', 'Research question?',
+        '--reviewers', 'reviewer_A, reviewer_B',
+        '--criteria', '{"population": "Urban adults"}',
+        '--db-path', db_path
+    ])
+
+    assert result.exit_code == 0
+
+    conn = get_database_connection(db_path)
+    review = ReviewDatabase(conn).get_review(1)
+    assert json.loads(review['inclusion_criteria_json']) == {'population': 'Urban adults'}
+    assert json.loads(review['reviewers_json']) == ['reviewer_A', 'reviewer_B']
+    conn.close()
+
+def test_create_review_invalid_criteria(tmp_path):
+    """Test invalid criteria JSON aborts without creating a review."""
+    runner = CliRunner()
+
+    result = runner.invoke(create_review, [
+        '--name', 'Bad Review',
+        '--question', 'Research question?',
+        '--reviewers', 'reviewer_A',
+        '--criteria', '{not json',
+        '--db-path', str(tmp_path / 'review.db')
+    ])
+
+    assert result.exit_code != 0
+    assert 'Invalid JSON' in result.output
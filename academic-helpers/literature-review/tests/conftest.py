@@ -1,7 +1,35 @@
 """Pytest configuration for literature-review tests."""
+import sqlite3
 import sys
 from pathlib import Path
 
+import pytest
+
 # Add parent directory to Python path so modules can be imported
 parent_dir = Path(__file__).parent.parent
 sys.path.insert(0, str(parent_dir))
+
+from database.connection import get_database_connection  # noqa: E402
+from database.queries import ReviewDatabase  # noqa: E402
+
+@pytest.fixture(scope='session')
+def schema_template():
+    """In-memory database with the schema applied once per test session."""
+    conn = get_database_connection(':memory:')
+    yield conn
+    conn.close()
+
+@pytest.fixture
+def db(schema_template):
+    """
+    Create an empty in-memory database for one test.
+
+    The schema is copied page-for-page from the session template instead
+    of re-running schema.sql, and each test gets its own connection so
+    commits inside the code under test stay isolated.
+    """
+    conn = sqlite3.connect(':memory:', cached_statements=256)
+    schema_template.backup(conn)
+    conn.row_factory = sqlite3.Row
+    yield ReviewDatabase(conn)
+    conn.close()
@@ -0,0 +1,46 @@
+# tests/database/test_connection.py
+from database.connection import (
+    get_database_connection,
+    get_shared_connection,
+    open_database,
+    close_shared_connections,
+)
+
+def test_shared_connection_reused(tmp_path):
+    """Test the same path returns the same open connection."""
+    db_path = str(tmp_path / 'review.db')
+
+    conn1 = get_shared_connection(db_path)
+    conn2 = get_shared_connection(db_path)
+
+    assert conn1 is conn2
+    assert conn1.execute("PRAGMA journal_mode").fetchone()[0] == 'wal'
+
+    close_shared_connections()
+
+def test_open_database_commits_and_stays_open(tmp_path):
+    """Test open_database commits on exit without closing the connection."""
+    db_path = str(tmp_path / 'review.db')
+
+    with open_database(db_path) as conn:
+        conn.execute("""
+            INSERT INTO reviews (review_name, research_question,
+                                 inclusion_criteria_json, reviewers_json)
+            VALUES ('Test', 'Q?', '{}', '[]')
+        """)
+
+    assert not conn.in_transaction
+    assert conn.execute("SELECT COUNT(*) FROM reviews").fetchone()[0] == 1
+
+    close_shared_connections()
+
+def test_file_connection_pragmas(tmp_path):
+    """Test file databases are opened with WAL, mmap and a larger cache."""
+    conn = get_database_connection(str(tmp_path / 'review.db'))
+
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == 'wal'
+    assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+    assert conn.execute("PRAGMA cache_size").fetchone()[0] == -65536
+    assert conn.execute("PRAGMA mmap_size").fetchone()[0] == 268435456
+
+    conn.close()
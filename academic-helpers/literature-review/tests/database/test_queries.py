@@ -1,14 +1,6 @@
 # tests/database/test_queries.py
 import pytest
 import json
-from database.connection import get_database_connection
-from database.queries import ReviewDatabase
-
-@pytest.fixture
-def db():
-    """Create in-memory database for testing."""
-    conn = get_database_connection(':memory:')
-    return ReviewDatabase(conn)
 
 def test_create_review(db):
     """Test creating a new review."""
@@ -37,6 +29,20 @@ def test_get_review(db):
     assert review['review_name'] == 'Test Review'
     assert review['research_question'] == 'What is the impact?'
 
+def test_create_review_serializes_python_objects(db):
+    """Test criteria and reviewers passed as objects are stored as JSON."""
+    review_id = db.create_review(
+        review_name='Test Review',
+        research_question='What is the impact?',
+        inclusion_criteria_json={'criteria': 'test'},
+        reviewers_json=['reviewer_A', 'reviewer_B']
+    )
+
+    review = db.get_review(review_id)
+
+    assert json.loads(review['inclusion_criteria_json']) == {'criteria': 'test'}
+    assert json.loads(review['reviewers_json']) == ['reviewer_A', 'reviewer_B']
+
 def test_link_paper_to_review(db):
     """Test linking a paper to a review."""
     review_id = db.create_review(
@@ -51,3 +57,128 @@ def test_link_paper_to_review(db):
     papers = db.get_review_papers(review_id)
     assert len(papers) == 1
     assert papers[0] == 'paper_001'
+
+def test_get_dual_screened_pairs(db):
+    """Test only papers with exactly two decisions are paired in screening order."""
+    review_id = db.create_review('Test', 'Q?', '{}', '[]')
+    db.link_paper_to_review(review_id, 'paper_001')
+    db.link_paper_to_review(review_id, 'paper_002')
+
+    db.insert_screening(review_id, 'paper_001', 'reviewer_B', 'title_abstract', 'include')
+    db.insert_screening(review_id, 'paper_001', 'reviewer_A', 'title_abstract', 'exclude', 'Bad')
+    db.insert_screening(review_id, 'paper_002', 'reviewer_A', 'title_abstract', 'include')
+
+    pairs = db.get_dual_screened_pairs(review_id, 'title_abstract')
+
+    assert len(pairs) == 1
+    assert pairs[0]['paper_id'] == 'paper_001'
+    assert pairs[0]['reviewer1'] == 'reviewer_B'
+    assert pairs[0]['decision1'] == 'include'
+    assert pairs[0]['reviewer2'] == 'reviewer_A'
+    assert pairs[0]['decision2'] == 'exclude'
+
+def test_insert_screening_many(db):
+    """Test bulk-recording screening decisions."""
+    review_id = db.create_review('Test', 'Q?', '{}', '[]')
+
+    count = db.insert_screening_many([
+        (review_id, 'paper_001', 'reviewer_A', 'title_abstract', 'include', None),
+        (review_id, 'paper_002', 'reviewer_A', 'title_abstract', 'exclude', 'Out of scope'),
+    ])
+
+    assert count == 2
+    decisions = db.get_screening_decisions(review_id, 'paper_002', 'title_abstract')
+    assert decisions[0].rationale == 'Out of scope'
+
+def test_insert_extraction_many(db):
+    """Test bulk-saving extractions."""
+    review_id = db.create_review('Test', 'Q?', '{}', '[]')
+
+    count = db.insert_extraction_many([
+        (review_id, 'paper_001', 'reviewer_A', 'observational_study', '{}'),
+        (review_id, 'paper_001', 'reviewer_B', 'observational_study', '{}'),
+    ])
+
+    assert count == 2
+    assert len(db.get_extractions(review_id, 'paper_001')) == 2
+
+def test_transaction_commits_grouped_inserts(db):
+    """Test inserts stay pending until the transaction block commits."""
+    with db.transaction():
+        review_id = db.create_review('Test', 'Q?', '{}', '[]')
+        db.link_paper_to_review(review_id, 'paper_001')
+        assert db.conn.in_transaction
+
+    assert not db.conn.in_transaction
+    assert db.get_review_papers(review_id) == ['paper_001']
+
+def test_transaction_rolls_back_on_error(db):
+    """Test a failing transaction block discards its inserts."""
+    with pytest.raises(RuntimeError):
+        with db.transaction():
+            review_id = db.create_review('Test', 'Q?', '{}', '[]')
+            raise RuntimeError('abort')
+
+    assert db.get_review(review_id) is None
+
+def test_bulk_insert_inside_transaction_does_not_commit_early(db):
+    """Test a bulk insert joins the caller's transaction and rolls back with it."""
+    with pytest.raises(RuntimeError):
+        with db.transaction():
+            review_id = db.create_review('Test', 'Q?', '{}', '[]')
+            db.insert_screening_many([
+                (review_id, 'paper_001', 'reviewer_A', 'title_abstract', 'include', None),
+            ])
+            assert db.conn.in_transaction
+            raise RuntimeError('abort')
+
+    assert db.get_review(review_id) is None
+    assert db.get_screening_decisions(review_id, 'paper_001', 'title_abstract') == []
+
+def test_get_review_extractions_with_field(db):
+    """Test only linked papers' extractions containing the field are returned."""
+    review_id = db.create_review('Test', 'Q?', '{}', '[]')
+    db.link_paper_to_review(review_id, 'paper_001')
+    db.link_paper_to_review(review_id, 'paper_002')
+
+    db.insert_extraction(review_id, 'paper_001', 'reviewer_A', 'observational_study',
+                         json.dumps({'main_results': ['Finding']}))
+    db.insert_extraction(review_id, 'paper_002', 'reviewer_A', 'observational_study',
+                         json.dumps({'sample_size': 10}))
+    db.insert_extraction(review_id, 'paper_003', 'reviewer_A', 'observational_study',
+                         json.dumps({'main_results': ['Unlinked']}))
+
+    extractions = db.get_review_extractions_with_field(review_id, 'main_results')
+
+    assert [e['paper_id'] for e in extractions] == ['paper_001']
+
+def test_get_review_extractions_with_field_quoted_name(db):
+    """Test field names with quotes or backslashes are matched, not spliced into the JSON path."""
+    review_id = db.create_review('Test', 'Q?', '{}', '[]')
+    db.link_paper_to_review(review_id, 'paper_001')
+    db.link_paper_to_review(review_id, 'paper_002')
+
+    db.insert_extraction(review_id, 'paper_001', 'reviewer_A', 'observational_study',
+                         json.dumps({'odd"name\\': 1}))
+    db.insert_extraction(review_id, 'paper_002', 'reviewer_A', 'observational_study',
+                         json.dumps({'main_results': ['Finding']}))
+
+    assert [e['paper_id'] for e in db.get_review_extractions_with_field(review_id, 'odd"name\\')] == ['paper_001']
+    assert db.get_review_extractions_with_field(review_id, '"') == []
+
+def test_get_review_extractions_with_field_nan_payload(db):
+    """Test payloads with NaN, which SQLite's JSON functions reject, don't break the query."""
+    review_id = db.create_review('Test', 'Q?', '{}', '[]')
+    db.link_paper_to_review(review_id, 'paper_001')
+    db.link_paper_to_review(review_id, 'paper_002')
+
+    db.insert_extraction(review_id, 'paper_001', 'reviewer_A', 'observational_study',
+                         json.dumps({'n': float('nan')}))
+    db.insert_extraction(review_id, 'paper_002', 'reviewer_A', 'observational_study',
+                         json.dumps({'n': 1, 'm': float('inf')}))
+
+    extractions = db.get_review_extractions_with_field(review_id, 'n')
+
+    assert [e['paper_id'] for e in extractions] == ['paper_001', 'paper_002']
+    assert 'json_ok' not in extractions[0]
+    assert db.get_review_extractions_with_field(review_id, 'missing') == []
@@ -34,3 +34,19 @@ def test_reviews_table_structure():
     assert columns['review_id'] == 'INTEGER'
 
     conn.close()
+
+def test_query_indexes_exist():
+    """Test composite indexes for hot query predicates are created."""
+    conn = get_database_connection(':memory:')
+    cursor = conn.cursor()
+
+    cursor.execute("SELECT name FROM sqlite_master WHERE type='index'")
+    indexes = {row[0] for row in cursor.fetchall()}
+
+    assert 'idx_review_papers_added' in indexes
+    assert 'idx_screening_review_paper_stage' in indexes
+    assert 'idx_screening_review_reviewer_stage' in indexes
+    assert 'idx_extraction_review_paper' in indexes
+    assert 'idx_themes_review' in indexes
+
+    conn.close()
@@ -1,4 +1,5 @@
 # tests/extraction/test_template_loader.py
+import os
 import pytest
 from extraction.template_loader import TemplateLoader
 
@@ -32,3 +33,38 @@ def test_list_templates():
     assert 'observational_study' in templates
     assert 'spatial_analysis' in templates
     assert 'qualitative_study' in templates
+
+def test_list_templates_refreshes_on_directory_change(tmp_path):
+    """Test cached listing is invalidated when the directory changes."""
+    (tmp_path / 'first.yaml').write_text('name: First\nfields: {}\n')
+    loader = TemplateLoader(str(tmp_path))
+
+    assert loader.list_templates() == ['first']
+
+    (tmp_path / 'second.yaml').write_text('name: Second\nfields: {}\n')
+    os.utime(tmp_path, ns=(0, os.stat(tmp_path).st_mtime_ns + 1_000_000_000))
+
+    assert loader.list_templates() == ['first', 'second']
+
+def test_load_template_returns_independent_copies():
+    """Test callers mutating a loaded template don't affect later loads."""
+    first = TemplateLoader().load_template('observational_study')
+    first['fields'].pop('study_design')
+
+    second = TemplateLoader().load_template('observational_study')
+
+    assert first is not second
+    assert 'study_design' in second['fields']
+
+def test_load_template_reparses_after_file_change(tmp_path):
+    """Test an edited template file is re-read instead of served from cache."""
+    path = tmp_path / 'custom.yaml'
+    path.write_text('name: First\nfields: {}\n')
+    loader = TemplateLoader(str(tmp_path))
+
+    assert loader.load_template('custom')['name'] == 'First'
+
+    path.write_text('name: Second\nfields: {}\n')
+    os.utime(path, ns=(0, os.stat(path).st_mtime_ns + 1_000_000_000))
+
+    assert loader.load_template('custom')['name'] == 'Second'
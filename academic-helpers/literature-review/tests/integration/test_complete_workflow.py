@@ -1,18 +1,9 @@
 """Integration test for complete literature review workflow."""
-import pytest
 import json
-from database.connection import get_database_connection
-from database.queries import ReviewDatabase
 from screening.interface import ScreeningInterface
 from quality.reliability import ReliabilityCalculator
 from extraction.template_loader import TemplateLoader
 
-@pytest.fixture
-def db():
-    """Create in-memory database."""
-    conn = get_database_connection(':memory:')
-    return ReviewDatabase(conn)
-
 def test_complete_workflow(db):
     """Test complete literature review workflow."""
 
@@ -45,10 +36,16 @@ def test_complete_workflow(db):
     screener.record_decision(review_id, 'paper_002', 'reviewer_A', 'title_abstract', 'exclude', 'Wrong population')
     screener.record_decision(review_id, 'paper_003', 'reviewer_A', 'title_abstract', 'include')
 
-    # Reviewer B screens
-    screener.record_decision(review_id, 'paper_001', 'reviewer_B', 'title_abstract', 'include')
-    screener.record_decision(review_id, 'paper_002', 'reviewer_B', 'title_abstract', 'exclude', 'Out of scope')
-    screener.record_decision(review_id, 'paper_003', 'reviewer_B', 'title_abstract', 'include')
+    # Reviewer B screens (batch import in one transaction)
+    recorded = screener.record_decisions_batch([
+        {'review_id': review_id, 'paper_id': 'paper_001', 'reviewer_id': 'reviewer_B',
+         'stage': 'title_abstract', 'decision': 'include'},
+        {'review_id': review_id, 'paper_id': 'paper_002', 'reviewer_id': 'reviewer_B',
+         'stage': 'title_abstract', 'decision': 'exclude', 'rationale': 'Out of scope'},
+        {'review_id': review_id, 'paper_id': 'paper_003', 'reviewer_id': 'reviewer_B',
+         'stage': 'title_abstract', 'decision': 'include'},
+    ])
+    assert recorded == 3
 
     # Step 4: Calculate screening reliability
     calculator = ReliabilityCalculator(db)
@@ -1,13 +1,5 @@
 import pytest
 from quality.reliability import ReliabilityCalculator
-from database.connection import get_database_connection
-from database.queries import ReviewDatabase
-
-@pytest.fixture
-def db():
-    """Create in-memory database."""
-    conn = get_database_connection(':memory:')
-    return ReviewDatabase(conn)
 
 @pytest.fixture
 def calculator(db):
@@ -48,3 +40,113 @@ def test_calculate_kappa_no_agreement(calculator, db):
 
     assert result['kappa'] < 0.2
     assert result['percent_agreement'] == 0.0
+
+def test_calculate_kappa_partial_agreement(calculator, db):
+    """Test kappa from contingency counts matches the closed form."""
+    review_id = db.create_review('Test', 'Q?', '{}', '[]')
+    for paper_id in ('paper_001', 'paper_002', 'paper_003', 'paper_004'):
+        db.link_paper_to_review(review_id, paper_id)
+
+    db.insert_screening(review_id, 'paper_001', 'reviewer_A', 'title_abstract', 'include')
+    db.insert_screening(review_id, 'paper_001', 'reviewer_B', 'title_abstract', 'include')
+    db.insert_screening(review_id, 'paper_002', 'reviewer_A', 'title_abstract', 'include')
+    db.insert_screening(review_id, 'paper_002', 'reviewer_B', 'title_abstract', 'exclude', 'Bad')
+    db.insert_screening(review_id, 'paper_003', 'reviewer_A', 'title_abstract', 'exclude', 'Bad')
+    db.insert_screening(review_id, 'paper_003', 'reviewer_B', 'title_abstract', 'exclude', 'Bad')
+    db.insert_screening(review_id, 'paper_004', 'reviewer_A', 'title_abstract', 'exclude', 'Bad')
+    db.insert_screening(review_id, 'paper_004', 'reviewer_B', 'title_abstract', 'exclude', 'Bad')
+
+    result = calculator.calculate_screening_kappa(
+        review_id, 'title_abstract', include_disagreements=True
+    )
+
+    # po = 3/4, pe = (2*1 + 2*3) / 16 = 1/2
+    assert result['kappa'] == pytest.approx(0.5)
+    assert result['interpretation'] == 'Moderate'
+    assert result['total_papers'] == 4
+    assert result['agreements'] == 3
+    assert [d['paper_id'] for d in result['disagreements']] == ['paper_002']
+
+def test_calculate_kappa_omits_disagreements_by_default(calculator, db):
+    """Test disagreement rows are only returned when requested."""
+    review_id = db.create_review('Test', 'Q?', '{}', '[]')
+    db.link_paper_to_review(review_id, 'paper_001')
+    db.insert_screening(review_id, 'paper_001', 'reviewer_A', 'title_abstract', 'include')
+    db.insert_screening(review_id, 'paper_001', 'reviewer_B', 'title_abstract', 'exclude', 'Bad')
+
+    result = calculator.calculate_screening_kappa(review_id, 'title_abstract')
+
+    assert 'disagreements' not in result
+    assert result['agreements'] == 0
+
+def test_calculate_kappa_for_reviewer_pair(calculator, db):
+    """Test kappa for two named reviewers on triple-screened papers."""
+    review_id = db.create_review('Test', 'Q?', '{}', '[]')
+    decisions = {
+        'paper_001': ('include', 'exclude', 'include'),
+        'paper_002': ('exclude', 'exclude', 'include'),
+        'paper_003': ('exclude', 'include', 'exclude'),
+        'paper_004': ('include', 'include', 'include'),
+    }
+    for paper_id, paper_decisions in decisions.items():
+        db.link_paper_to_review(review_id, paper_id)
+        for reviewer_id, decision in zip(('reviewer_A', 'reviewer_B', 'reviewer_C'), paper_decisions):
+            db.insert_screening(review_id, paper_id, reviewer_id, 'title_abstract', decision, 'Bad')
+
+    result = calculator.calculate_screening_kappa(
+        review_id,
+        'title_abstract',
+        include_disagreements=True,
+        reviewers=('reviewer_A', 'reviewer_C')
+    )
+
+    # po = 3/4, pe = (2*3 + 2*1) / 16 = 1/2
+    assert result['kappa'] == pytest.approx(0.5)
+    assert result['total_papers'] == 4
+    assert [
+        (d['paper_id'], d['reviewer1'], d['decision1'], d['decision2'])
+        for d in result['disagreements']
+    ] == [('paper_002', 'reviewer_A', 'exclude', 'include')]
+
+    # Default pairing only considers papers screened exactly twice
+    assert 'error' in calculator.calculate_screening_kappa(review_id, 'title_abstract')
+
+def test_cohens_kappa_perfect_agreement_fast_path(calculator, monkeypatch):
+    """Test perfect agreement returns kappa 1 without building the matrix."""
+    import quality.reliability as reliability
+    monkeypatch.setattr(reliability, 'np', None)
+
+    contingency = [
+        {'decision1': 'include', 'decision2': 'include', 'pair_count': 3},
+        {'decision1': 'exclude', 'decision2': 'exclude', 'pair_count': 5},
+    ]
+
+    assert calculator._cohens_kappa(contingency) == (1.0, 8, 8)
+
+@pytest.mark.parametrize('kappa, expected', [
+    (-0.1, 'Poor'),
+    (0.0, 'Slight'),
+    (0.2, 'Fair'),
+    (0.59, 'Moderate'),
+    (0.6, 'Substantial'),
+    (0.8, 'Almost Perfect'),
+    (1.0, 'Almost Perfect'),
+])
+def test_interpret_kappa_boundaries(calculator, kappa, expected):
+    """Test Landis & Koch bands, with each threshold starting the next band."""
+    assert calculator._interpret_kappa(kappa) == expected
+
+def test_cohens_kappa_known_value(calculator):
+    """Test _cohens_kappa against a worked 2x2 example (kappa 0.4)."""
+    contingency = [
+        {'decision1': 'include', 'decision2': 'include', 'pair_count': 20},
+        {'decision1': 'include', 'decision2': 'exclude', 'pair_count': 5},
+        {'decision1': 'exclude', 'decision2': 'include', 'pair_count': 10},
+        {'decision1': 'exclude', 'decision2': 'exclude', 'pair_count': 15},
+    ]
+
+    kappa, total, agreed = calculator._cohens_kappa(contingency)
+
+    # po = 35/50 = 0.7, pe = (25*30 + 25*20) / 50^2 = 0.5
+    assert kappa == pytest.approx(0.4)
+    assert (total, agreed) == (50, 35)
@@ -1,14 +1,6 @@
 # tests/screening/test_interface.py
 import pytest
 from screening.interface import ScreeningInterface
-from database.connection import get_database_connection
-from database.queries import ReviewDatabase
-
-@pytest.fixture
-def db():
-    """Create in-memory database."""
-    conn = get_database_connection(':memory:')
-    return ReviewDatabase(conn)
 
 @pytest.fixture
 def screener(db):
@@ -34,7 +26,7 @@ def test_record_decision_include(screener, db):
 
     decisions = db.get_screening_decisions(review_id, 'paper_001', 'title_abstract')
     assert len(decisions) == 1
-    assert decisions[0]['decision'] == 'include'
+    assert decisions[0].decision == 'include'
 
 def test_record_exclude_without_rationale_fails(screener, db):
     """Test that exclude decisions require rationale."""
@@ -64,4 +56,33 @@ def test_record_exclude_with_rationale_succeeds(screener, db):
     )
 
     decisions = db.get_screening_decisions(review_id, 'paper_001', 'title_abstract')
-    assert decisions[0]['rationale'] == 'Not in scope'
+    assert decisions[0].rationale == 'Not in scope'
+
+def test_get_papers_needing_screening(screener, db):
+    """Test only papers unscreened by this reviewer at this stage are returned."""
+    review_id = db.create_review('Test', 'Q?', '{}', '[]')
+    db.link_paper_to_review(review_id, 'paper_001')
+    db.link_paper_to_review(review_id, 'paper_002')
+    db.link_paper_to_review(review_id, 'paper_003')
+
+    screener.record_decision(review_id, 'paper_001', 'reviewer_A', 'title_abstract', 'include')
+    screener.record_decision(review_id, 'paper_002', 'reviewer_B', 'title_abstract', 'include')
+    screener.record_decision(review_id, 'paper_003', 'reviewer_A', 'full_text', 'include')
+
+    papers = screener.get_papers_needing_screening(review_id, 'reviewer_A', 'title_abstract')
+
+    assert papers == ['paper_002', 'paper_003']
+
+def test_record_decisions_batch_validates_before_writing(screener, db):
+    """Test a batch with an unjustified exclude records nothing."""
+    review_id = db.create_review('Test', 'Q?', '{}', '[]')
+
+    with pytest.raises(ValueError, match="paper_002"):
+        screener.record_decisions_batch([
+            {'review_id': review_id, 'paper_id': 'paper_001', 'reviewer_id': 'reviewer_A',
+             'stage': 'title_abstract', 'decision': 'include'},
+            {'review_id': review_id, 'paper_id': 'paper_002', 'reviewer_id': 'reviewer_A',
+             'stage': 'title_abstract', 'decision': 'exclude'},
+        ])
+
+    assert db.get_screening_decisions(review_id, 'paper_001', 'title_abstract') == []
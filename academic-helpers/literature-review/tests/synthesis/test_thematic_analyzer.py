@@ -1,15 +1,13 @@
 # tests/synthesis/test_thematic_analyzer.py
 import pytest
 import json
-from synthesis.thematic_analyzer import ThematicSynthesizer
-from database.connection import get_database_connection
-from database.queries import ReviewDatabase
-
-@pytest.fixture
-def db():
-    """Create in-memory database."""
-    conn = get_database_connection(':memory:')
-    return ReviewDatabase(conn)
+import sys
+import types
+from synthesis.thematic_analyzer import (
+    ThematicSynthesizer,
+    _ai_deps_available,
+    _get_embedder
+)
 
 @pytest.fixture
 def synthesizer(db):
@@ -31,6 +29,21 @@ def test_suggest_themes_manual_mode(synthesizer, db):
     assert result['mode'] == 'manual'
     assert 'extractions' in result
 
+def test_manual_mode_decodes_nan_payloads(synthesizer, db):
+    """Test payloads with NaN, which orjson rejects, still decode."""
+    review_id = db.create_review('Test', 'Q?', '{}', '[]')
+    db.link_paper_to_review(review_id, 'paper_001')
+    db.insert_extraction(
+        review_id, 'paper_001', 'reviewer_A', 'observational_study',
+        json.dumps({'main_results': ['Finding'], 'effect_size': float('nan')})
+    )
+
+    result = synthesizer.suggest_themes(review_id, field_name='main_results')
+
+    data = result['extractions'][0]['extracted_data']
+    assert data['main_results'] == ['Finding']
+    assert data['effect_size'] != data['effect_size']  # NaN
+
 @pytest.mark.skipif(
     not ThematicSynthesizer._check_ai_dependencies(),
     reason="AI dependencies not available"
@@ -55,3 +68,107 @@ def test_suggest_themes_ai_mode(db):
     assert result['mode'] == 'ai'
     assert 'themes' in result
     assert len(result['themes']) > 0
+
+def test_embedder_loaded_once(monkeypatch):
+    """Test the embedding model is constructed once and reused."""
+    loads = []
+
+    class FakeSentenceTransformer:
+        def __init__(self, model_name):
+            loads.append(model_name)
+
+    fake_module = types.ModuleType('sentence_transformers')
+    fake_module.SentenceTransformer = FakeSentenceTransformer
+    monkeypatch.setitem(sys.modules, 'sentence_transformers', fake_module)
+    _get_embedder.cache_clear()
+
+    try:
+        assert _get_embedder('fake-model') is _get_embedder('fake-model')
+        assert loads == ['fake-model']
+    finally:
+        _get_embedder.cache_clear()
+
+@pytest.mark.parametrize('max_precomputed', [2000, 0])
+def test_suggest_themes_clusters_normalized_embeddings(db, monkeypatch, max_precomputed):
+    """Test findings within cosine distance 0.5 cluster on both DBSCAN paths."""
+    monkeypatch.setattr(
+        'synthesis.thematic_analyzer.PRECOMPUTED_MAX_FINDINGS', max_precomputed
+    )
+    np = pytest.importorskip('numpy')
+    cluster_mod = pytest.importorskip('sklearn.cluster')
+
+    vectors = {
+        'Food deserts limit access': [1.0, 0.0],
+        'Food access limited by distance': [0.9, 0.436],
+        'Unrelated finding': [0.0, 1.0],
+    }
+
+    class FakeEmbedder:
+        def encode(self, texts, **kwargs):
+            assert kwargs['normalize_embeddings'] is True
+            return np.array([vectors[t] for t in texts])
+
+    synthesizer = ThematicSynthesizer(db, use_ai=False)
+    synthesizer.use_ai = True
+    synthesizer.embedder = FakeEmbedder()
+    synthesizer.DBSCAN = cluster_mod.DBSCAN
+
+    review_id = db.create_review('Test', 'Q?', '{}', '[]')
+    db.link_paper_to_review(review_id, 'paper_001')
+    db.insert_extraction(
+        review_id, 'paper_001', 'reviewer_A', 'observational_study',
+        json.dumps({'main_results': list(vectors)})
+    )
+
+    result = synthesizer.suggest_themes(review_id, field_name='main_results')
+
+    assert len(result['themes']) == 1
+    assert result['clustered_findings'] == 2
+    assert result['unclustered_findings'] == 1
+
+def test_extract_keywords_skips_stopwords(synthesizer):
+    """Test theme names come from the most common non-stop words."""
+    name = synthesizer._extract_keywords([
+        'Distance with transport barriers',
+        'Transport distance from stores',
+        'Transport costs with distance',
+    ])
+
+    assert name == 'Distance + Transport + Barriers'
+
+def test_ai_dependencies_loaded_lazily(db, monkeypatch):
+    """Test construction defers AI imports and falls back when unavailable."""
+    monkeypatch.setitem(sys.modules, 'sentence_transformers', None)
+    _get_embedder.cache_clear()
+
+    synthesizer = ThematicSynthesizer(db, use_ai=True)
+    assert synthesizer.embedder is None
+
+    review_id = db.create_review('Test', 'Q?', '{}', '[]')
+    result = synthesizer.suggest_themes(review_id)
+
+    assert result['mode'] == 'manual'
+    assert synthesizer.use_ai is False
+
+def test_ai_dependency_probe_cached(monkeypatch):
+    """Test the AI dependency probe runs once per process."""
+    import importlib.util
+
+    probes = []
+    real_find_spec = importlib.util.find_spec
+
+    def counting_find_spec(name, *args):
+        probes.append(name)
+        return real_find_spec(name, *args)
+
+    monkeypatch.setattr(importlib.util, 'find_spec', counting_find_spec)
+    _ai_deps_available.cache_clear()
+
+    try:
+        first = ThematicSynthesizer._check_ai_dependencies()
+        probe_count = len(probes)
+
+        assert ThematicSynthesizer._check_ai_dependencies() == first
+        assert len(probes) == probe_count
+    finally:
+        _ai_deps_available.cache_clear()
@@ -2,9 +2,25 @@
 
 __version__ = "0.1.0"
 
-# Import main classes for package-level access
-from .pipeline import PaperReader
-from .database import Database
-from .config import get_config
+# Package-level names, imported on first access (PEP 562) so that
+# `import paper_reader` does not pull in PyMuPDF and the pipeline.
+_LAZY_ATTRS = {
+    'PaperReader': '.pipeline',
+    'Database': '.database',
+    'get_config': '.config',
+}
 
 __all__ = ['PaperReader', 'Database', 'get_config']
+
+
+def __getattr__(name):
+    if name in _LAZY_ATTRS:
+        from importlib import import_module
+        value = getattr(import_module(_LAZY_ATTRS[name], __name__), name)
+        globals()[name] = value  # cache so __getattr__ runs once per name
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
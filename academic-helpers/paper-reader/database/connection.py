@@ -2,13 +2,44 @@ import sqlite3
 import os
 
 
+_SCHEMA_PATH = os.path.join(os.path.dirname(__file__), 'schema.sql')
+_SCHEMA_SQL = None  # schema.sql text, read once per process
+
+
+def _load_schema():
+    """Read schema.sql on first use and return the cached text."""
+    global _SCHEMA_SQL
+    if _SCHEMA_SQL is None and os.path.exists(_SCHEMA_PATH):
+        with open(_SCHEMA_PATH, 'r') as f:
+            _SCHEMA_SQL = f.read()
+    return _SCHEMA_SQL
+
+
+def _is_memory_database(db_path):
+    """Whether db_path names an in-memory database (plain or URI)."""
+    return (
+        db_path == ':memory:'
+        or db_path.startswith('file::memory:')
+        or (db_path.startswith('file:') and 'mode=memory' in db_path)
+    )
+
+
+def _has_schema(conn):
+    """Whether another connection already created the papers table."""
+    return conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'papers'"
+    ).fetchone() is not None
+
+
 def get_database_connection(db_path=None):
     """
     Get database connection with schema initialized.
 
     Args:
-        db_path: Path to database file. If None, uses default.
-                 Use ':memory:' for in-memory database.
+        db_path: Path to database file (str or path-like). If None, uses default.
+                 Use ':memory:' for in-memory database, or a URI such as
+                 'file:papers?mode=memory&cache=shared' for an in-memory
+                 database shared by every connection in the process.
 
     Returns:
         sqlite3.Connection
@@ -19,14 +50,40 @@ def get_database_connection(db_path=None):
             '..',
             'papers.db'
         )
+    db_path = os.fspath(db_path)
+
+    in_memory = _is_memory_database(db_path)
 
-    conn = sqlite3.connect(db_path)
+    # Larger statement cache keeps repeated search/insert plans prepared
+    conn = sqlite3.connect(
+        db_path,
+        cached_statements=256,
+        uri=db_path.startswith('file:')
+    )
     conn.row_factory = sqlite3.Row  # Enable column access by name
 
-    # Initialize schema
-    schema_path = os.path.join(os.path.dirname(__file__), 'schema.sql')
-    if os.path.exists(schema_path):
-        with open(schema_path, 'r') as f:
-            conn.executescript(f.read())
+    # Initialize schema (once per shared in-memory database)
+    schema_sql = _load_schema()
+    if schema_sql and not (in_memory and _has_schema(conn)):
+        conn.executescript(schema_sql)
+
+    _apply_pragmas(conn, in_memory)
 
     return conn
+
+
+def _apply_pragmas(conn, in_memory):
+    """Bulk-write tuning; WAL does not apply to in-memory databases."""
+    pragmas = ["PRAGMA temp_store=MEMORY"]
+    if in_memory:
+        # Nothing survives the process anyway: skip syncs, journal in RAM
+        pragmas += ["PRAGMA journal_mode=MEMORY", "PRAGMA synchronous=OFF"]
+    else:
+        pragmas += ["PRAGMA journal_mode=WAL", "PRAGMA synchronous=NORMAL"]
+
+    for pragma in pragmas:
+        try:
+            conn.execute(pragma)
+        except sqlite3.OperationalError:
+            # e.g. WAL unavailable on read-only filesystems; keep defaults
+            pass
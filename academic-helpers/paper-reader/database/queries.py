@@ -1,7 +1,90 @@
+import re
 import sqlite3
 import json
+from dataclasses import dataclass
 from typing import Dict, List, Any, Optional
 
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> str:
+        """Serialize to a JSON string with orjson's C encoder."""
+        return orjson.dumps(obj).decode()
+except ImportError:
+    _dumps = json.dumps
+
+
+@dataclass(slots=True)
+class Paper:
+    """A row from the papers table, in PAPER_COLUMNS order."""
+    paper_id: str
+    file_path: str
+    title: str
+    authors_json: Optional[str]
+    year: Optional[int]
+    journal: Optional[str]
+    volume: Optional[str]
+    issue: Optional[str]
+    pages: Optional[str]
+    doi: Optional[str]
+    abstract: Optional[str]
+    keywords_json: Optional[str]
+    date_added: Optional[str]
+    date_modified: Optional[str]
+    ml_enhanced: Optional[int]
+
+
+# Explicit column list pins the positional order Paper(*row) relies on
+PAPER_COLUMNS = """
+    p.paper_id, p.file_path, p.title, p.authors_json, p.year,
+    p.journal, p.volume, p.issue, p.pages, p.doi, p.abstract,
+    p.keywords_json, p.date_added, p.date_modified, p.ml_enhanced
+"""
+
+# FTS5 rows feed the papers lookup directly; best BM25 matches first
+SEARCH_PAPERS_SQL = f"""
+    SELECT {PAPER_COLUMNS}
+    FROM papers_fts f
+    JOIN papers p ON p.paper_id = f.paper_id
+    WHERE papers_fts MATCH ?
+    ORDER BY f.rank
+    LIMIT ?
+"""
+
+# Same matches in index order, skipping the BM25 ranking pass
+SEARCH_PAPERS_UNRANKED_SQL = f"""
+    SELECT {PAPER_COLUMNS}
+    FROM papers_fts f
+    JOIN papers p ON p.paper_id = f.paper_id
+    WHERE papers_fts MATCH ?
+    LIMIT ?
+"""
+
+INSERT_PAPER_SQL = """
+    INSERT INTO papers (
+        paper_id, file_path, title, authors_json, year,
+        journal, volume, issue, pages, doi, abstract, keywords_json
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+INSERT_SECTION_SQL = """
+    INSERT INTO sections (paper_id, section_name, content, word_count)
+    VALUES (?, ?, ?, ?)
+"""
+
+# Whitespace-delimited words, matching str.split() with no arguments
+_WORD_RE = re.compile(r'\S+')
+
+# Sections longer than this are counted without building a word list
+WORD_COUNT_SPLIT_MAX = 10_000
+
+
+def _word_count(content: str) -> int:
+    """Count whitespace-delimited words in section text."""
+    if len(content) <= WORD_COUNT_SPLIT_MAX:
+        return len(content.split())
+    return sum(1 for _ in _WORD_RE.finditer(content))
+
 
 class PaperDatabase:
     """Database operations for paper storage and retrieval."""
@@ -21,21 +104,35 @@ class PaperDatabase:
             paper_id of inserted paper
         """
         cursor = self.conn.cursor()
+        cursor.execute(INSERT_PAPER_SQL, self._paper_row(paper_data))
+
+        self.conn.commit()
+        return paper_data['paper_id']
+
+    def insert_papers_bulk(self, papers: List[Dict[str, Any]]) -> int:
+        """
+        Insert many papers in a single transaction.
+
+        Args:
+            papers: List of paper metadata dictionaries
+
+        Returns:
+            Number of papers inserted
+        """
+        rows = [self._paper_row(paper_data) for paper_data in papers]
+
+        with self.conn:
+            cursor = self.conn.executemany(INSERT_PAPER_SQL, rows)
 
-        # Convert lists to JSON
-        authors_json = json.dumps(paper_data.get('authors', []))
-        keywords_json = json.dumps(paper_data.get('keywords', []))
+        return cursor.rowcount
 
-        cursor.execute("""
-            INSERT INTO papers (
-                paper_id, file_path, title, authors_json, year,
-                journal, volume, issue, pages, doi, abstract, keywords_json
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
+    def _paper_row(self, paper_data: Dict[str, Any]) -> tuple:
+        """Build INSERT_PAPER_SQL parameters from paper metadata."""
+        return (
             paper_data['paper_id'],
             paper_data['file_path'],
             paper_data.get('title', ''),
-            authors_json,
+            _dumps(paper_data.get('authors', [])),
             paper_data.get('year'),
             paper_data.get('journal', ''),
             paper_data.get('volume', ''),
@@ -43,11 +140,8 @@ class PaperDatabase:
             paper_data.get('pages', ''),
             paper_data.get('doi', ''),
             paper_data.get('abstract', ''),
-            keywords_json
-        ))
-
-        self.conn.commit()
-        return paper_data['paper_id']
+            _dumps(paper_data.get('keywords', []))
+        )
 
     def get_paper(self, paper_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -68,29 +162,31 @@ class PaperDatabase:
 
         return dict(row)
 
-    def search_papers(self, query: str, limit: int = 10) -> List[Dict[str, Any]]:
+    def search_papers(
+        self,
+        query: str,
+        limit: int = 10,
+        rank: bool = True
+    ) -> List[Paper]:
         """
         Full-text search across papers.
 
         Args:
             query: Search query (FTS5 syntax)
             limit: Maximum number of results
+            rank: Order by BM25 relevance. False skips ranking and returns
+                  up to limit matches in no particular order, for callers
+                  that only need to know what matches
 
         Returns:
-            List of matching papers
+            List of matching papers, most relevant first when ranked
         """
         cursor = self.conn.cursor()
 
-        cursor.execute("""
-            SELECT p.*
-            FROM papers p
-            WHERE p.paper_id IN (
-                SELECT paper_id FROM papers_fts WHERE papers_fts MATCH ?
-            )
-            LIMIT ?
-        """, (query, limit))
+        sql = SEARCH_PAPERS_SQL if rank else SEARCH_PAPERS_UNRANKED_SQL
+        cursor.execute(sql, (query, limit))
 
-        return [dict(row) for row in cursor.fetchall()]
+        return [Paper(*row) for row in cursor]
 
     def add_to_collection(self, paper_id: str, collection_name: str) -> None:
         """
@@ -100,30 +196,22 @@ class PaperDatabase:
             paper_id: Paper ID
             collection_name: Collection name
         """
-        cursor = self.conn.cursor()
-
-        # Create collection if it doesn't exist
-        cursor.execute("""
-            INSERT OR IGNORE INTO collections (name)
-            VALUES (?)
-        """, (collection_name,))
-
-        # Get collection ID
-        cursor.execute(
-            "SELECT collection_id FROM collections WHERE name = ?",
-            (collection_name,)
-        )
-        collection_id = cursor.fetchone()[0]
-
-        # Add paper to collection
-        cursor.execute("""
-            INSERT OR IGNORE INTO paper_collections (paper_id, collection_id)
-            VALUES (?, ?)
-        """, (paper_id, collection_id))
-
-        self.conn.commit()
-
-    def get_papers_in_collection(self, collection_name: str) -> List[Dict[str, Any]]:
+        with self.conn:
+            # Create collection if needed and get its ID in one statement
+            # (no-op upsert so RETURNING also fires for existing names)
+            collection_id = self.conn.execute("""
+                INSERT INTO collections (name) VALUES (?)
+                ON CONFLICT(name) DO UPDATE SET name = excluded.name
+                RETURNING collection_id
+            """, (collection_name,)).fetchone()[0]
+
+            # Add paper to collection
+            self.conn.execute("""
+                INSERT OR IGNORE INTO paper_collections (paper_id, collection_id)
+                VALUES (?, ?)
+            """, (paper_id, collection_id))
+
+    def get_papers_in_collection(self, collection_name: str) -> List[Paper]:
         """
         Get all papers in a collection.
 
@@ -135,15 +223,15 @@ class PaperDatabase:
         """
         cursor = self.conn.cursor()
 
-        cursor.execute("""
-            SELECT p.*
+        cursor.execute(f"""
+            SELECT {PAPER_COLUMNS}
             FROM papers p
             JOIN paper_collections pc ON p.paper_id = pc.paper_id
             JOIN collections c ON pc.collection_id = c.collection_id
             WHERE c.name = ?
         """, (collection_name,))
 
-        return [dict(row) for row in cursor.fetchall()]
+        return [Paper(*row) for row in cursor]
 
     def insert_section(self, paper_id: str, section_name: str, content: str) -> int:
         """
@@ -159,10 +247,35 @@ class PaperDatabase:
         """
         cursor = self.conn.cursor()
 
-        cursor.execute("""
-            INSERT INTO sections (paper_id, section_name, content, word_count)
-            VALUES (?, ?, ?, ?)
-        """, (paper_id, section_name, content, len(content.split())))
+        cursor.execute(
+            INSERT_SECTION_SQL,
+            (paper_id, section_name, content, _word_count(content))
+        )
 
         self.conn.commit()
         return cursor.lastrowid
+
+    def insert_sections_bulk(self, sections: List[Dict[str, Any]]) -> int:
+        """
+        Insert many sections in a single transaction.
+
+        Args:
+            sections: List of dictionaries with paper_id, section_name, content
+
+        Returns:
+            Number of sections inserted
+        """
+        rows = [
+            (
+                section['paper_id'],
+                section['section_name'],
+                section['content'],
+                _word_count(section['content'])
+            )
+            for section in sections
+        ]
+
+        with self.conn:
+            cursor = self.conn.executemany(INSERT_SECTION_SQL, rows)
+
+        return cursor.rowcount
@@ -1,58 +1,190 @@
-import fitz  # PyMuPDF
-from typing import Dict, List, Any
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterator, List, Any, Optional
+
+
+# PDFs with fewer pages are parsed in-process (pool startup outweighs the gain)
+PARALLEL_MIN_PAGES = 8
+
+
+def _parse_page_range(
+    pdf_path: str,
+    start: int,
+    stop: int,
+    font_info: bool = False,
+    extract_blocks: bool = True
+) -> List[Dict[str, Any]]:
+    """Parse pages [start, stop) of a PDF; runs in a worker process."""
+    import fitz  # PyMuPDF
+
+    parser = PDFParser(max_workers=1, font_info=font_info)
+    doc_obj = fitz.open(pdf_path)
+    try:
+        return [
+            parser._parse_page(doc_obj[page_num], page_num, extract_blocks)
+            for page_num in range(start, stop)
+        ]
+    finally:
+        doc_obj.close()
 
 
 class PDFParser:
     """Parse PDF files using PyMuPDF."""
 
-    def __init__(self):
-        """Initialize PDF parser."""
-        pass
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        parallel_min_pages: int = PARALLEL_MIN_PAGES,
+        font_info: bool = False
+    ):
+        """
+        Initialize PDF parser.
 
-    def parse(self, pdf_path: str) -> Dict[str, Any]:
+        Args:
+            max_workers: Worker processes for large PDFs (None = CPU count,
+                         1 = always parse in-process)
+            parallel_min_pages: Page count at which parsing is parallelized
+            font_info: Extract per-span font size/name (slower 'dict' pass)
+                       instead of MuPDF's flat block tuples
+        """
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.parallel_min_pages = parallel_min_pages
+        self.font_info = font_info
+
+    def parse(self, pdf_path: str, extract_blocks: bool = False) -> Dict[str, Any]:
         """
         Parse PDF file and extract structured content.
 
         Args:
             pdf_path: Path to PDF file
+            extract_blocks: Also extract per-page layout blocks; when False
+                            only plain text is extracted and blocks is None
 
         Returns:
             Document dictionary with text, pages, metadata
         """
-        doc_obj = fitz.open(pdf_path)
+        # Imported here so importing the package doesn't load PyMuPDF
+        import fitz  # PyMuPDF
 
         document = self._create_empty_document()
-        document['page_count'] = len(doc_obj)
 
-        # Extract text from all pages
-        full_text = []
-        pages = []
+        # Closed on every path, including parse errors
+        with fitz.open(pdf_path) as doc_obj:
+            page_count = len(doc_obj)
+            parallel = self.max_workers > 1 and page_count >= self.parallel_min_pages
+            if not parallel:
+                pages = [
+                    self._parse_page(page, page_num, extract_blocks)
+                    for page_num, page in enumerate(doc_obj)
+                ]
 
-        for page_num in range(len(doc_obj)):
-            page = doc_obj[page_num]
-            text = page.get_text()
+        document['page_count'] = page_count
 
-            pages.append({
-                'page_num': page_num + 1,
-                'text': text,
-                'blocks': self._extract_blocks(page)
-            })
+        if parallel:
+            # Workers open their own handles; ours is already closed
+            pages = self._parse_parallel(pdf_path, page_count, extract_blocks)
 
-            full_text.append(text)
-
-        document['text'] = '\n\n'.join(full_text)
+        document['text'] = '\n\n'.join(page['text'] for page in pages)
         document['pages'] = pages
 
-        doc_obj.close()
         return document
 
-    def _extract_blocks(self, page) -> List[Dict[str, Any]]:
-        """Extract text blocks with font information."""
-        blocks = []
+    def iter_pages(
+        self,
+        pdf_path: str,
+        extract_blocks: bool = False
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Parse a PDF one page at a time.
+
+        Unlike parse(), only the current page is held in memory, so large
+        PDFs can be written out (e.g. with insert_sections_bulk) as they
+        are read. Pages are always parsed in-process.
+
+        Args:
+            pdf_path: Path to PDF file
+            extract_blocks: Also extract per-page layout blocks
+
+        Yields:
+            Page dictionaries as in parse()['pages']
+        """
+        import fitz  # PyMuPDF
+
+        doc_obj = fitz.open(pdf_path)
+        try:
+            for page_num, page in enumerate(doc_obj):
+                yield self._parse_page(page, page_num, extract_blocks)
+        finally:
+            doc_obj.close()
+
+    def _parse_parallel(
+        self,
+        pdf_path: str,
+        page_count: int,
+        extract_blocks: bool
+    ) -> List[Dict[str, Any]]:
+        """Parse contiguous page ranges in worker processes, in page order."""
+        workers = min(self.max_workers, page_count)
+        chunk_size = -(-page_count // workers)  # ceil division
+        starts = range(0, page_count, chunk_size)
+        stops = [min(start + chunk_size, page_count) for start in starts]
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            chunks = executor.map(
+                _parse_page_range,
+                [pdf_path] * len(starts),
+                starts,
+                stops,
+                [self.font_info] * len(starts),
+                [extract_blocks] * len(starts)
+            )
+            return [page for chunk in chunks for page in chunk]
+
+    def _parse_page(self, page, page_num: int, extract_blocks: bool) -> Dict[str, Any]:
+        """Parse a single page from one text extraction pass."""
+        if not extract_blocks:
+            # Plain text only: no layout or font analysis
+            return {
+                'page_num': page_num + 1,
+                'text': page.get_text(),
+                'blocks': None
+            }
+
+        if not self.font_info:
+            # Flat (x0, y0, x1, y1, text, block_no, block_type) tuples
+            text_blocks = [
+                block for block in page.get_text('blocks') if block[6] == 0
+            ]
+            return {
+                'page_num': page_num + 1,
+                'text': ''.join(block[4] for block in text_blocks),
+                'blocks': [
+                    {'text': block[4], 'bbox': block[:4]}
+                    for block in text_blocks
+                ]
+            }
 
-        # Get text blocks with font info
         text_dict = page.get_text('dict')
 
+        return {
+            'page_num': page_num + 1,
+            'text': self._text_from_dict(text_dict),
+            'blocks': self._extract_blocks(text_dict)
+        }
+
+    def _text_from_dict(self, text_dict: Dict[str, Any]) -> str:
+        """Rebuild plain page text (one line per text line) from get_text('dict')."""
+        return ''.join(
+            ''.join(span['text'] for span in line['spans']) + '\n'
+            for block in text_dict.get('blocks', [])
+            if 'lines' in block
+            for line in block['lines']
+        )
+
+    def _extract_blocks(self, text_dict: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Extract per-span text blocks with font information."""
+        blocks = []
+
         for block in text_dict.get('blocks', []):
             if 'lines' in block:  # Text block
                 for line in block['lines']:
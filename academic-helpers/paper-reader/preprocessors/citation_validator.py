@@ -5,11 +5,43 @@ This module validates citations against CrossRef database and detects
 duplicate papers using DOI matching and fuzzy title similarity.
 """
 
+import asyncio
+import os
+import threading
 import time
 import re
-from typing import Dict, List, Optional, Any, Tuple
+import warnings
+from collections import defaultdict
+from dataclasses import asdict, dataclass, field
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Any, Tuple, Union
 from difflib import SequenceMatcher
 import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import requests_cache
+except ImportError:  # Responses are simply not cached
+    requests_cache = None
+
+try:
+    import orjson
+except ImportError:  # Decode with requests' stdlib json
+    orjson = None
+
+try:
+    from rapidfuzz import fuzz, process
+    from rapidfuzz.distance import JaroWinkler
+except ImportError:  # Fall back to the pure-Python difflib matcher
+    fuzz = process = JaroWinkler = None
+
+try:
+    from Levenshtein import ratio as _lev_ratio
+except ImportError:  # python-Levenshtein missing too: use difflib
+    def _lev_ratio(norm1: str, norm2: str) -> float:
+        """SequenceMatcher.ratio() of two strings."""
+        return SequenceMatcher(None, norm1, norm2).ratio()
 
 from academic_helpers.paper_reader.config import get_config
 from academic_helpers.paper_reader.utils import (
@@ -23,6 +55,264 @@ from academic_helpers.paper_reader.utils import (
 
 logger = get_logger(__name__)
 
+# In-flight CrossRef requests allowed by validate_async
+MAX_CONCURRENT_REQUESTS = 50
+
+# Worker threads used by validate(): serial unless the caller opts in
+DEFAULT_VALIDATION_WORKERS = 1
+
+# Suggested validate() max_workers for callers opting into threads
+PARALLEL_VALIDATION_WORKERS = 20
+
+# Title similarity treated as an exact match; scanning stops there
+EXACT_TITLE_SIMILARITY = 0.99
+
+# Title similarity metrics (CitationValidator's title_metric)
+TITLE_METRIC_RATIO = 'ratio'  # Indel ratio, same scores as SequenceMatcher
+TITLE_METRIC_JARO_WINKLER = 'jaro_winkler'  # Rewards shared leading words; needs rapidfuzz
+
+# CrossRef title match needed for MEDIUM confidence (ratio metric)
+TITLE_MATCH_THRESHOLD = 0.8
+
+# Jaro-Winkler scores run higher than ratio, so it uses bibliometrix's
+# default for both duplicate detection and CrossRef title matches
+JARO_WINKLER_THRESHOLD = 0.9
+
+# Suggested per-user location for the opt-in CrossRef response cache
+# (pass as cache_path; needs requests-cache)
+CROSSREF_CACHE_PATH = os.path.join(
+    os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache'),
+    'paper-reader',
+    'crossref_cache.sqlite'
+)
+CROSSREF_CACHE_EXPIRE = 30 * 86400  # seconds
+
+# Title/name normalization patterns, compiled once
+_PUNCT_RE = re.compile(r'[^\w\s]+')
+_NON_WORD_RE = re.compile(r'\W+')
+
+
+@lru_cache(maxsize=8192)
+def _normalize_title(text: str) -> str:
+    """
+    Lowercase a title and strip punctuation and extra whitespace.
+
+    Cached: the same existing-paper and CrossRef titles recur across
+    check_duplicate and validation calls.
+    """
+    # Remove punctuation
+    text = _PUNCT_RE.sub('', text)
+    # Remove extra whitespace
+    text = ' '.join(text.split())
+    return text.lower()
+
+
+def _block_key(paper: Dict[str, Any]) -> Optional[Tuple[str, int]]:
+    """
+    Blocking key (first-author surname, year) for duplicate candidates.
+
+    Returns None when the author or year is missing or unusable.
+    """
+    authors = paper.get('authors')
+    if not authors or not authors[0]:
+        return None
+
+    # "Family, Given" or "Given Family"
+    first_author = authors[0]
+    if ',' in first_author:
+        surname = first_author.split(',')[0]
+    else:
+        surname = first_author.rsplit(None, 1)[-1] if first_author.strip() else ''
+    surname = _NON_WORD_RE.sub('', surname).lower()
+
+    try:
+        year = int(paper.get('year'))
+    except (TypeError, ValueError):
+        return None
+
+    return (surname, year) if surname else None
+
+
+def _response_json(response: requests.Response) -> Any:
+    """Decode a CrossRef JSON response, with orjson when installed."""
+    if orjson is None:
+        return response.json()
+
+    try:
+        return orjson.loads(response.content)
+    except orjson.JSONDecodeError as e:
+        # Same exception family as response.json() so callers' handling holds
+        raise requests.exceptions.InvalidJSONError(str(e), response=response) from e
+
+
+@lru_cache(maxsize=None)
+def _get_crossref_session(cache_path: Optional[str]) -> requests.Session:
+    """
+    Process-wide CrossRef session per cache file.
+
+    Shared by every CitationValidator so keep-alive connections (and
+    their TLS handshakes) are reused across instances.
+    """
+    if cache_path is not None:
+        os.makedirs(os.path.dirname(os.path.abspath(cache_path)), exist_ok=True)
+        session = requests_cache.CachedSession(
+            cache_path,
+            backend='sqlite',
+            expire_after=CROSSREF_CACHE_EXPIRE,
+            allowable_codes=(200, 404)
+        )
+    else:
+        session = requests.Session()
+
+    # Enough pooled keep-alive connections for validate_async's workers
+    session.mount('https://', HTTPAdapter(pool_maxsize=MAX_CONCURRENT_REQUESTS))
+    return session
+
+
+def _similarity_upper_bound(len1: int, len2: int) -> float:
+    """
+    Best similarity two titles of these lengths could reach.
+
+    All ratio matchers score 2 * matched_chars / (len1 + len2), and at most
+    min(len1, len2) characters can match, so titles whose bound is below
+    the score needed can be rejected without running the matcher.
+    """
+    total = len1 + len2
+    return 2 * min(len1, len2) / total if total else 1.0
+
+
+def _normalized_title_similarity(norm1: str, norm2: str) -> float:
+    """Similarity (0.0 to 1.0) of two already-normalized titles."""
+    if fuzz is not None:
+        # Indel-based ratio, same scale as SequenceMatcher.ratio() in C++
+        return fuzz.ratio(norm1, norm2) / 100.0
+    # python-Levenshtein's C ratio (same scale), else difflib
+    return _lev_ratio(norm1, norm2)
+
+
+def _titles_comparable(
+    has_doi: bool,
+    block: Optional[Tuple[str, int]],
+    other_has_doi: bool,
+    other_block: Optional[Tuple[str, int]]
+) -> bool:
+    """Whether two papers (already known not to share a DOI) need a title comparison."""
+    # Both have DOIs and they differ: distinct works
+    if has_doi and other_has_doi:
+        return False
+
+    # Only fuzzy-match within the same (first author, year) block;
+    # papers missing either are always compared
+    return block is None or other_block is None or block == other_block
+
+
+@dataclass(slots=True)
+class Reference:
+    """
+    Compact citation record for large reference lists.
+
+    Accepted wherever a reference dictionary is (validate,
+    validate_async); stored without a per-instance __dict__.
+    """
+    title: str = ''
+    authors: List[str] = field(default_factory=list)
+    year: Optional[int] = None
+    doi: str = ''
+
+
+ReferenceLike = Union[Dict[str, Any], Reference]
+
+
+def _reference_dict(reference: ReferenceLike) -> Dict[str, Any]:
+    """Reference as the dictionary form used in validation results."""
+    if isinstance(reference, Reference):
+        return asdict(reference)
+    return reference
+
+
+def _dedupe_references(
+    references: List[ReferenceLike]
+) -> Tuple[List[ReferenceLike], List[int], List[int]]:
+    """
+    Group references by normalized (DOI, title).
+
+    References with neither a DOI nor a title each get their own group:
+    there is nothing to tell them apart by.
+
+    Returns:
+        Tuple of (first reference of each group, its 1-based position in
+        references, group index of every reference)
+    """
+    groups: Dict[Tuple[str, str], int] = {}
+    unique_refs = []
+    numbers = []
+    positions = []
+
+    for i, reference in enumerate(references, 1):
+        ref = _reference_dict(reference)
+        key = (
+            normalize_doi(ref['doi']) if ref.get('doi') else '',
+            _normalize_title(ref['title']) if ref.get('title') else ''
+        )
+        if key == ('', ''):
+            position = len(unique_refs)
+        else:
+            position = groups.setdefault(key, len(unique_refs))
+
+        # First of its group
+        if position == len(unique_refs):
+            unique_refs.append(reference)
+            numbers.append(i)
+        positions.append(position)
+
+    return unique_refs, numbers, positions
+
+
+def _expand_results(
+    references: List[ReferenceLike],
+    unique_results: List[Dict[str, Any]],
+    positions: List[int]
+) -> List[Dict[str, Any]]:
+    """Give every reference its group's result, keeping its own original."""
+    results = []
+    seen = set()
+
+    for reference, position in zip(references, positions):
+        result = unique_results[position]
+        if position in seen:
+            # Repeat of an earlier reference: copy, pointing at this one
+            ref = _reference_dict(reference)
+            result = dict(result, original=ref)
+            if unique_results[position]['validated'] is unique_results[position]['original']:
+                result['validated'] = ref
+        seen.add(position)
+        results.append(result)
+
+    return results
+
+
+@dataclass(frozen=True, slots=True)
+class ExistingPapersIndex:
+    """
+    Normalized view of existing papers for duplicate checks.
+
+    Built once with CitationValidator.build_index; paper_ids through
+    blocks are parallel tuples in the original paper order.
+    """
+    paper_ids: Tuple[Optional[str], ...]
+    titles: Tuple[str, ...]  # normalized; '' when missing
+    has_doi: Tuple[bool, ...]
+    blocks: Tuple[Optional[Tuple[str, int]], ...]
+    doi_map: Dict[str, Optional[str]]  # normalized DOI -> first paper_id
+    block_members: Dict[Tuple[str, int], Tuple[int, ...]]  # block -> positions
+    unblocked: Tuple[int, ...]  # positions of papers without a block
+
+    def candidates(self, block: Optional[Tuple[str, int]]) -> List[int]:
+        """Positions, in paper order, that a paper in block may duplicate."""
+        if block is None:
+            return list(range(len(self.titles)))
+        return sorted(self.block_members.get(block, ()) + self.unblocked)
+
 
 class CitationValidator:
     """
@@ -40,106 +330,401 @@ class CitationValidator:
     CONFIDENCE_MEDIUM = 'MEDIUM'  # Title match >80%
     CONFIDENCE_LOW = 'LOW'      # Title match <80%
 
-    def __init__(self):
-        """Initialize citation validator with configuration."""
+    def __init__(
+        self,
+        cache_path: Optional[str] = None,
+        title_metric: str = TITLE_METRIC_RATIO
+    ):
+        """
+        Initialize citation validator with configuration.
+
+        Args:
+            cache_path: SQLite file caching CrossRef responses (DOI and
+                        title queries, including 404s) across runs, e.g.
+                        CROSSREF_CACHE_PATH. None (default) disables
+                        caching. Requires requests-cache.
+            title_metric: TITLE_METRIC_RATIO (default) or
+                          TITLE_METRIC_JARO_WINKLER, which replaces the
+                          configured duplicate threshold and the 0.8
+                          CrossRef match threshold with JARO_WINKLER_THRESHOLD
+
+        Raises:
+            ValueError: If title_metric is unknown
+            ImportError: If Jaro-Winkler is requested without rapidfuzz
+        """
         self.config = get_config()
-        self._crossref_session = requests.Session()
-        self._crossref_session.headers.update(self.config.get_crossref_headers())
-        self._last_request_time = 0
+        self._set_title_metric(title_metric)
+        if requests_cache is None:
+            cache_path = None
+        # Shared across validators, so headers go on each request instead
+        self._crossref_session = _get_crossref_session(cache_path)
+        self._crossref_headers = self.config.get_crossref_headers()
+        # time.monotonic() of the last request start or response, whichever
+        # is later (immune to clock jumps)
+        self._last_request_time = float('-inf')
+        # Duration of the last CrossRef HTTP call
+        self._last_request_duration = 0.0
         self._min_request_interval = 1.0 / 50.0  # 50 requests/second max
-
-    def validate(self, references: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        # Spaces request starts across validate()'s worker threads
+        self._rate_lock = threading.Lock()
+        # Normalized DOI -> paper_id for papers passed to register_existing
+        self._doi_index: Dict[str, str] = {}
+
+    def _set_title_metric(self, title_metric: str):
+        """Select the title scorer and the thresholds calibrated for it."""
+        if title_metric == TITLE_METRIC_JARO_WINKLER:
+            if JaroWinkler is None:
+                raise ImportError("title_metric='jaro_winkler' requires rapidfuzz")
+            # Already on a 0.0 to 1.0 scale
+            self._scorer = JaroWinkler.normalized_similarity
+            self._score_scale = 1.0
+            self._duplicate_threshold = JARO_WINKLER_THRESHOLD
+            self._match_threshold = JARO_WINKLER_THRESHOLD
+        elif title_metric == TITLE_METRIC_RATIO:
+            self._scorer = fuzz.ratio if fuzz is not None else None
+            self._score_scale = 100.0
+            self._duplicate_threshold = self.config.DUPLICATE_TITLE_THRESHOLD
+            self._match_threshold = TITLE_MATCH_THRESHOLD
+        else:
+            raise ValueError(f"Unknown title_metric: {title_metric!r}")
+
+        self.title_metric = title_metric
+
+    def _title_similarity(self, norm1: str, norm2: str) -> float:
+        """Similarity (0.0 to 1.0) of two normalized titles under title_metric."""
+        if self.title_metric == TITLE_METRIC_JARO_WINKLER:
+            return JaroWinkler.normalized_similarity(norm1, norm2)
+        return _normalized_title_similarity(norm1, norm2)
+
+    def _title_upper_bound(self, len1: int, len2: int) -> float:
+        """Length-only similarity bound; Jaro-Winkler has no useful one."""
+        if self.title_metric == TITLE_METRIC_JARO_WINKLER:
+            return 1.0
+        return _similarity_upper_bound(len1, len2)
+
+    def validate(
+        self,
+        references: List[ReferenceLike],
+        max_workers: int = DEFAULT_VALIDATION_WORKERS
+    ) -> List[Dict[str, Any]]:
         """
         Validate list of references against CrossRef database.
 
+        References are validated one at a time unless max_workers > 1
+        (e.g. PARALLEL_VALIDATION_WORKERS). In both modes, request starts
+        are spaced to respect the CrossRef rate limit.
+
+        Worker threads share this validator's CrossRef session. With a
+        cache_path, that is a requests-cache CachedSession writing to a
+        single SQLite file, so concurrent writers depend on
+        requests-cache's locking. Keep the default serial mode when
+        caching unless that has been verified for the installed version.
+
         Args:
-            references: List of reference dictionaries with fields:
+            references: List of reference dictionaries (or Reference records) with fields:
                 - title: Citation title (required)
                 - authors: List of author names (optional)
                 - year: Publication year (optional)
                 - doi: DOI if available (optional)
+            max_workers: Worker threads (default 1 = validate serially)
 
         Returns:
-            List of validated citations with confidence levels and canonical metadata
+            List of validated citations with confidence levels and canonical
+            metadata, in the same order as references
         """
-        logger.info(f"Validating {len(references)} citations...")
+        # Query CrossRef once per distinct DOI/title
+        unique_refs, numbers, positions = _dedupe_references(references)
+        logger.info(f"Validating {len(references)} citations ({len(unique_refs)} unique)...")
 
-        validated_citations = []
+        serial = max_workers <= 1
 
-        for i, ref in enumerate(references, 1):
+        def validate_one(i: int, ref: ReferenceLike) -> Dict[str, Any]:
             try:
                 logger.debug(f"Validating citation {i}/{len(references)}")
 
-                # Validate citation
-                validated = self._validate_single_citation(ref)
-                validated_citations.append(validated)
+                # Serially, a previous request that took the whole interval
+                # already spaced this one out
+                if not serial or self._last_request_duration < self._min_request_interval:
+                    self._apply_rate_limit()
 
-                # Rate limiting
-                self._apply_rate_limit()
+                return self._validate_single_citation(ref)
 
             except Exception as e:
                 logger.warning(f"Failed to validate citation {i}: {e}")
-                # Add citation with low confidence
-                validated_citations.append({
-                    'original': ref,
-                    'validated': ref,
-                    'confidence': self.CONFIDENCE_LOW,
-                    'validation_error': str(e),
-                })
+                return self._failed_citation(ref, e)
+
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            unique_results = list(executor.map(validate_one, numbers, unique_refs))
+
+        validated_citations = _expand_results(references, unique_results, positions)
+
+        logger.info(f"Validation complete: {len(validated_citations)} citations processed")
+        return validated_citations
+
+    async def validate_async(
+        self,
+        references: List[ReferenceLike],
+        max_concurrency: int = MAX_CONCURRENT_REQUESTS
+    ) -> List[Dict[str, Any]]:
+        """
+        Validate references with concurrent CrossRef requests.
+
+        Same results as validate(), in the same order, but up to
+        max_concurrency lookups are in flight at once. Request starts are
+        still spaced to stay within the CrossRef rate limit.
+
+        Args:
+            references: List of reference dictionaries (see validate)
+            max_concurrency: Maximum simultaneous CrossRef requests
+
+        Returns:
+            List of validated citations with confidence levels and canonical metadata
+        """
+        unique_refs, numbers, positions = _dedupe_references(references)
+        logger.info(
+            f"Validating {len(references)} citations "
+            f"({len(unique_refs)} unique) concurrently..."
+        )
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+        rate_lock = asyncio.Lock()
+
+        async def validate_one(i: int, ref: ReferenceLike) -> Dict[str, Any]:
+            async with semaphore:
+                # Serialize request starts so they stay spaced out
+                async with rate_lock:
+                    await self._apply_rate_limit_async()
+
+                try:
+                    # Blocking HTTP runs in a worker thread
+                    return await asyncio.to_thread(self._validate_single_citation, ref)
+                except Exception as e:
+                    logger.warning(f"Failed to validate citation {i}: {e}")
+                    return self._failed_citation(ref, e)
+
+        unique_results = await asyncio.gather(*(
+            validate_one(i, ref) for i, ref in zip(numbers, unique_refs)
+        ))
+
+        validated_citations = _expand_results(references, unique_results, positions)
 
         logger.info(f"Validation complete: {len(validated_citations)} citations processed")
         return validated_citations
 
+    def _failed_citation(self, reference: ReferenceLike, error: Exception) -> Dict[str, Any]:
+        """Keep a citation that could not be validated, with low confidence."""
+        reference = _reference_dict(reference)
+        return {
+            'original': reference,
+            'validated': reference,
+            'confidence': self.CONFIDENCE_LOW,
+            'validation_error': str(error),
+        }
+
+    def register_existing(self, papers: List[Dict[str, Any]]) -> None:
+        """
+        Index existing papers by normalized DOI for check_duplicate.
+
+        Registered DOIs are matched with a single dict lookup instead of
+        re-normalizing every existing paper's DOI on each check.
+
+        Args:
+            papers: Existing paper metadata dictionaries (with paper_id, doi)
+        """
+        for paper in papers:
+            if paper.get('doi'):
+                self._doi_index.setdefault(
+                    normalize_doi(paper['doi']),
+                    paper.get('paper_id')
+                )
+
     def check_duplicate(
         self,
         paper_metadata: Dict[str, Any],
-        existing_papers: List[Dict[str, Any]]
+        existing_papers: Union[ExistingPapersIndex, List[Dict[str, Any]]]
     ) -> Optional[Tuple[str, float]]:
         """
         Check if paper is duplicate of existing papers.
 
+        Build the index once with build_index and pass it to every call;
+        DOI lookups are then a dict probe and title comparisons only
+        visit the paper's (first author, year) block.
+
         Args:
             paper_metadata: Metadata of paper to check (with title, doi)
-            existing_papers: List of existing paper metadata dictionaries
+            existing_papers: ExistingPapersIndex of existing papers (in
+                addition to any passed to register_existing). A list of
+                paper metadata dictionaries is still accepted but
+                deprecated: it is re-indexed on every call.
 
         Returns:
             Tuple of (paper_id, similarity_score) if duplicate found, None otherwise
         """
-        # Check DOI match first (exact duplicate)
-        if paper_metadata.get('doi'):
-            doi = normalize_doi(paper_metadata['doi'])
-            for existing in existing_papers:
-                if existing.get('doi'):
-                    existing_doi = normalize_doi(existing['doi'])
-                    if doi == existing_doi:
-                        logger.info(f"Duplicate found by DOI: {doi}")
-                        return (existing.get('paper_id'), 1.0)
-
-        # Check title similarity
-        if paper_metadata.get('title'):
-            title = paper_metadata['title'].lower().strip()
-
-            for existing in existing_papers:
-                if existing.get('title'):
-                    existing_title = existing['title'].lower().strip()
-                    similarity = self._calculate_title_similarity(title, existing_title)
-
-                    if similarity >= self.config.DUPLICATE_TITLE_THRESHOLD:
-                        logger.info(f"Duplicate found by title similarity: {similarity:.2%}")
-                        return (existing.get('paper_id'), similarity)
+        if not isinstance(existing_papers, ExistingPapersIndex):
+            warnings.warn(
+                "Passing a list of papers to check_duplicate is deprecated; "
+                "pass build_index(papers) instead",
+                DeprecationWarning,
+                stacklevel=2
+            )
+            existing_papers = self.build_index(existing_papers)
+
+        title = paper_metadata.get('title')
+        return self._batch_duplicate(
+            paper_metadata,
+            _normalize_title(title) if title else '',
+            existing_papers,
+            None,
+            self._duplicate_threshold
+        )
+
+    def build_index(self, papers: List[Dict[str, Any]]) -> ExistingPapersIndex:
+        """
+        Normalize and block existing papers once for duplicate checks.
+
+        Args:
+            papers: Existing paper metadata dictionaries
+
+        Returns:
+            ExistingPapersIndex over papers
+        """
+        doi_map = {}
+        for paper in papers:
+            if paper.get('doi'):
+                doi_map.setdefault(normalize_doi(paper['doi']), paper.get('paper_id'))
+
+        blocks = tuple(_block_key(paper) for paper in papers)
+        block_members = defaultdict(list)
+        unblocked = []
+        for j, block in enumerate(blocks):
+            if block is None:
+                unblocked.append(j)
+            else:
+                block_members[block].append(j)
+
+        return ExistingPapersIndex(
+            paper_ids=tuple(paper.get('paper_id') for paper in papers),
+            titles=tuple(
+                _normalize_title(paper['title']) if paper.get('title') else ''
+                for paper in papers
+            ),
+            has_doi=tuple(bool(paper.get('doi')) for paper in papers),
+            blocks=blocks,
+            doi_map=doi_map,
+            block_members={
+                block: tuple(members) for block, members in block_members.items()
+            },
+            unblocked=tuple(unblocked)
+        )
+
+    def check_duplicate_batch(
+        self,
+        new_papers: List[Dict[str, Any]],
+        index: ExistingPapersIndex
+    ) -> List[Optional[Tuple[str, float]]]:
+        """
+        Check many papers against an index of existing papers.
+
+        Applies the same rules as check_duplicate to each paper. With
+        rapidfuzz installed, all title similarities are scored in one
+        multithreaded cdist call.
+
+        Args:
+            new_papers: Metadata of papers to check (with title, doi)
+            index: Existing papers from build_index
+
+        Returns:
+            Per new paper, (paper_id, similarity_score) if duplicate, else None
+        """
+        threshold = self._duplicate_threshold
+        new_titles = [
+            _normalize_title(paper['title']) if paper.get('title') else ''
+            for paper in new_papers
+        ]
+
+        scores = None
+        if self._scorer is not None and new_titles and index.titles:
+            # len(new) x len(existing) matrix; scores under the cutoff are 0
+            scores = process.cdist(
+                new_titles,
+                index.titles,
+                scorer=self._scorer,
+                score_cutoff=threshold * self._score_scale,
+                workers=-1
+            )
+
+        results = []
+        for i, paper in enumerate(new_papers):
+            results.append(self._batch_duplicate(
+                paper,
+                new_titles[i],
+                index,
+                scores[i] if scores is not None else None,
+                threshold
+            ))
+
+        return results
+
+    def _batch_duplicate(
+        self,
+        paper: Dict[str, Any],
+        title: str,
+        index: ExistingPapersIndex,
+        row_scores: Optional[Any],
+        threshold: float
+    ) -> Optional[Tuple[str, float]]:
+        """Duplicate check for one paper against an index (row_scores from cdist)."""
+        if paper.get('doi'):
+            doi = normalize_doi(paper['doi'])
+            for doi_map in (self._doi_index, index.doi_map):
+                if doi in doi_map:
+                    logger.info(f"Duplicate found by DOI: {doi}")
+                    return (doi_map[doi], 1.0)
+
+        if not title:
+            return None
+
+        has_doi = bool(paper.get('doi'))
+        block = _block_key(paper)
+
+        if row_scores is not None:
+            # Only existing papers that reached the threshold, in order
+            candidates = row_scores.nonzero()[0]
+        else:
+            candidates = index.candidates(block)
+
+        for j in candidates:
+            existing_title = index.titles[j]
+            if not existing_title:
+                continue
+            if not _titles_comparable(has_doi, block, index.has_doi[j], index.blocks[j]):
+                continue
+
+            if row_scores is not None:
+                similarity = float(row_scores[j]) / self._score_scale
+            elif self._title_upper_bound(len(title), len(existing_title)) < threshold:
+                continue
+            else:
+                similarity = self._title_similarity(title, existing_title)
+
+            if similarity >= threshold:
+                logger.info(f"Duplicate found by title similarity: {similarity:.2%}")
+                return (index.paper_ids[j], similarity)
 
         return None
 
-    def _validate_single_citation(self, reference: Dict[str, Any]) -> Dict[str, Any]:
+    def _validate_single_citation(self, reference: ReferenceLike) -> Dict[str, Any]:
         """
         Validate a single citation.
 
         Args:
-            reference: Citation dictionary
+            reference: Citation dictionary or Reference
 
         Returns:
             Validated citation with confidence level
         """
+        reference = _reference_dict(reference)
+
         # If DOI present, validate via CrossRef
         if reference.get('doi'):
             doi = normalize_doi(reference['doi'])
@@ -172,7 +757,7 @@ class CitationValidator:
         try:
             # Query CrossRef for canonical metadata
             url = f"{self.config.CROSSREF_API_BASE}/works/{doi}"
-            response = self._crossref_session.get(url, timeout=10)
+            response = self._crossref_get(url)
 
             if response.status_code == 404:
                 logger.warning(f"DOI not found in CrossRef: {doi}")
@@ -184,7 +769,7 @@ class CitationValidator:
                 }
 
             response.raise_for_status()
-            data = response.json()
+            data = _response_json(response)
 
             if 'message' not in data:
                 raise CrossRefAPIError("Invalid CrossRef response")
@@ -229,9 +814,9 @@ class CitationValidator:
                 'rows': 5,  # Top 5 matches
             }
 
-            response = self._crossref_session.get(url, params=params, timeout=10)
+            response = self._crossref_get(url, params=params)
             response.raise_for_status()
-            data = response.json()
+            data = _response_json(response)
 
             if 'message' not in data or 'items' not in data['message']:
                 raise CrossRefAPIError("Invalid CrossRef response")
@@ -248,23 +833,10 @@ class CitationValidator:
                 }
 
             # Find best match using title similarity
-            best_match = None
-            best_similarity = 0.0
-
-            for item in items:
-                if 'title' in item and item['title']:
-                    crossref_title = item['title'][0].lower().strip()
-                    similarity = self._calculate_title_similarity(
-                        title.lower(),
-                        crossref_title
-                    )
-
-                    if similarity > best_similarity:
-                        best_similarity = similarity
-                        best_match = item
+            best_match, best_similarity = self._best_title_match(title, items)
 
             # Determine confidence based on similarity
-            if best_similarity >= 0.8:
+            if best_similarity >= self._match_threshold:
                 confidence = self.CONFIDENCE_MEDIUM
             else:
                 confidence = self.CONFIDENCE_LOW
@@ -289,6 +861,54 @@ class CitationValidator:
                 'validation_method': 'title_api_error',
             }
 
+    def _best_title_match(
+        self,
+        title: str,
+        items: List[Dict[str, Any]]
+    ) -> Tuple[Optional[Dict[str, Any]], float]:
+        """
+        Find the CrossRef item whose title is most similar to title.
+
+        Args:
+            title: Citation title
+            items: CrossRef work items
+
+        Returns:
+            Tuple of (best item or None, similarity 0.0 to 1.0)
+        """
+        normalized_title = _normalize_title(title)
+        titled_items = [item for item in items if item.get('title')]
+        choices = [_normalize_title(item['title'][0]) for item in titled_items]
+
+        if self._scorer is not None:
+            # Whole scan in one C++ call; first item wins ties and the
+            # scan stops early at a perfect score
+            match = process.extractOne(normalized_title, choices, scorer=self._scorer)
+            if match is None or match[1] <= 0:
+                return None, 0.0
+            return titled_items[match[2]], match[1] / self._score_scale
+
+        best_match = None
+        best_similarity = 0.0
+
+        for item, item_title in zip(titled_items, choices):
+            # Cannot beat the current best on length alone
+            bound = self._title_upper_bound(len(normalized_title), len(item_title))
+            if bound <= best_similarity:
+                continue
+
+            similarity = self._title_similarity(normalized_title, item_title)
+
+            if similarity > best_similarity:
+                best_similarity = similarity
+                best_match = item
+
+                # Remaining items cannot meaningfully improve on this
+                if similarity >= EXACT_TITLE_SIMILARITY:
+                    break
+
+        return best_match, best_similarity
+
     def _extract_crossref_metadata(self, crossref_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Extract standard metadata from CrossRef API response.
@@ -307,13 +927,13 @@ class CitationValidator:
 
         # Authors
         if 'author' in crossref_data:
-            authors = []
-            for author in crossref_data['author']:
-                given = author.get('given', '')
-                family = author.get('family', '')
-                if family:
-                    authors.append(f"{family}, {given}".strip(', '))
-            metadata['authors'] = authors
+            # "Family, Given", or just "Family" when no given name
+            metadata['authors'] = [
+                f"{author['family']}, {author['given']}" if author.get('given')
+                else author['family']
+                for author in crossref_data['author']
+                if author.get('family')
+            ]
 
         # Year
         if 'published' in crossref_data:
@@ -343,40 +963,70 @@ class CitationValidator:
 
     def _calculate_title_similarity(self, title1: str, title2: str) -> float:
         """
-        Calculate similarity between two titles using Levenshtein distance.
+        Calculate similarity between two titles.
+
+        Scored with the validator's title_metric: Jaro-Winkler, or the
+        ratio metric via rapidfuzz or python-Levenshtein when installed,
+        otherwise difflib.SequenceMatcher.
 
         Args:
-            title1: First title (normalized)
-            title2: Second title (normalized)
+            title1: First title
+            title2: Second title
 
         Returns:
             Similarity score (0.0 to 1.0)
         """
-        # Normalize titles (remove punctuation, extra spaces)
-        def normalize(text: str) -> str:
-            # Remove punctuation
-            text = re.sub(r'[^\w\s]', '', text)
-            # Remove extra whitespace
-            text = ' '.join(text.split())
-            return text.lower()
-
-        norm1 = normalize(title1)
-        norm2 = normalize(title2)
+        return self._title_similarity(
+            _normalize_title(title1),
+            _normalize_title(title2)
+        )
 
-        # Calculate sequence matcher ratio
-        similarity = SequenceMatcher(None, norm1, norm2).ratio()
+    def _crossref_get(self, url: str, **kwargs) -> requests.Response:
+        """
+        GET from CrossRef, recording when the response arrived.
 
-        return similarity
+        The next request is spaced from the response rather than from the
+        start, and serial validation skips the wait entirely once a call
+        has taken the whole interval.
+        """
+        start = time.monotonic()
+        try:
+            return self._crossref_session.get(
+                url, headers=self._crossref_headers, timeout=10, **kwargs
+            )
+        finally:
+            finished = time.monotonic()
+            self._last_request_duration = finished - start
+            with self._rate_lock:
+                # Never move back past a later start from another thread
+                self._last_request_time = max(self._last_request_time, finished)
 
     def _apply_rate_limit(self):
         """
         Apply rate limiting for CrossRef API (max 50 requests/second).
+
+        Thread-safe: concurrent callers take the next slot in turn.
+        """
+        with self._rate_lock:
+            current_time = time.monotonic()
+            elapsed = current_time - self._last_request_time
+
+            if elapsed < self._min_request_interval:
+                sleep_time = self._min_request_interval - elapsed
+                time.sleep(sleep_time)
+                current_time = time.monotonic()
+
+            self._last_request_time = current_time
+
+    async def _apply_rate_limit_async(self):
+        """
+        Wait for the next CrossRef request slot without blocking the event loop.
         """
-        current_time = time.time()
+        current_time = time.monotonic()
         elapsed = current_time - self._last_request_time
 
         if elapsed < self._min_request_interval:
-            sleep_time = self._min_request_interval - elapsed
-            time.sleep(sleep_time)
+            await asyncio.sleep(self._min_request_interval - elapsed)
+            current_time = time.monotonic()
 
-        self._last_request_time = time.time()
+        self._last_request_time = current_time
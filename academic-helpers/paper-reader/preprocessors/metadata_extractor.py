@@ -1,7 +1,33 @@
 import re
+from types import MappingProxyType
 from typing import Dict, List, Any, Optional
 
 
+# Whole filename in one match: text before the first four-digit
+# publication year (1900-2099), the year, and the text after it
+_FILENAME_RE = re.compile(
+    r'(?P<before>.*?)\b(?P<year>(?:19|20)\d{2})\b(?P<after>.*)',
+    re.DOTALL
+)
+
+# Read-only defaults for _create_empty_metadata; list fields are
+# replaced with fresh lists on every copy
+_EMPTY_METADATA = MappingProxyType({
+    'title': '',
+    'authors': [],
+    'year': None,
+    'journal': '',
+    'volume': '',
+    'issue': '',
+    'pages': '',
+    'doi': '',
+    'abstract': '',
+    'keywords': [],
+    'extraction_source': 'unknown',
+    'confidence': 0.0
+})
+
+
 class MetadataExtractor:
     """Extract metadata from PDF files using multiple strategies."""
 
@@ -31,21 +57,19 @@ class MetadataExtractor:
         name = filename.replace('.pdf', '').replace('_', ' ')
 
         # Pattern: Author_Year_Title
-        # Look for 4-digit year
-        year_match = re.search(r'\b(19|20)\d{2}\b', name)
-        if year_match:
-            year = int(year_match.group(0))
-            metadata['year'] = year
+        # Author, year and title come from a single regex pass
+        match = _FILENAME_RE.match(name)
+        if match:
+            metadata['year'] = int(match['year'])
 
             # Text before year is likely author
-            before_year = name[:year_match.start()].strip()
+            before_year = match['before'].split()
             if before_year:
                 # Take first word as author surname
-                author = before_year.split()[0]
-                metadata['authors'] = [author]
+                metadata['authors'] = [before_year[0]]
 
             # Text after year is likely title
-            after_year = name[year_match.end():].strip()
+            after_year = match['after'].strip()
             if after_year:
                 metadata['title'] = after_year
 
@@ -59,19 +83,18 @@ class MetadataExtractor:
 
         return metadata
 
+    def extract_batch(self, filenames: List[str]) -> List[Dict[str, Any]]:
+        """
+        Extract metadata from many filenames.
+
+        Args:
+            filenames: PDF filenames
+
+        Returns:
+            Metadata dictionaries, in the same order as filenames
+        """
+        return [self.extract_from_filename(filename) for filename in filenames]
+
     def _create_empty_metadata(self) -> Dict[str, Any]:
         """Create empty metadata structure."""
-        return {
-            'title': '',
-            'authors': [],
-            'year': None,
-            'journal': '',
-            'volume': '',
-            'issue': '',
-            'pages': '',
-            'doi': '',
-            'abstract': '',
-            'keywords': [],
-            'extraction_source': 'unknown',
-            'confidence': 0.0
-        }
+        return {**_EMPTY_METADATA, 'authors': [], 'keywords': []}
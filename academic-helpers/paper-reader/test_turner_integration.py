@@ -82,10 +82,10 @@ try:
     print("  Attempting to parse PDF...")
 
     import fitz  # PyMuPDF
-    doc = fitz.open(TURNER_PDF)
-    page_count = len(doc)
-    first_page_text = doc[0].get_text()
-    doc.close()
+    # Closed even if text extraction fails
+    with fitz.open(TURNER_PDF) as doc:
+        page_count = len(doc)
+        first_page_text = doc[0].get_text()
 
     print(f"  Pages: {page_count}")
     print(f"  First page text length: {len(first_page_text)} chars")
@@ -145,7 +145,7 @@ try:
     print(f"  Search results for 'food': {len(results)} papers")
 
     if len(results) > 0:
-        print(f"  Found paper: {results[0]['title']}")
+        print(f"  Found paper: {results[0].title}")
 
     assert len(results) >= 1, "Should find the stored paper"
 
@@ -57,7 +57,7 @@ def test_search_papers_fts():
     results = db.search_papers('urban', limit=10)
 
     assert len(results) == 1
-    assert results[0]['paper_id'] == 'p1'
+    assert results[0].paper_id == 'p1'
     conn.close()
 
 
@@ -82,5 +82,143 @@ def test_add_to_collection():
     # Verify paper is in collection
     papers = db.get_papers_in_collection('food_systems')
     assert len(papers) == 1
-    assert papers[0]['paper_id'] == 'p1'
+    assert papers[0].paper_id == 'p1'
+    assert papers[0].title == 'Test Paper'
+    assert papers[0].year == 2020
     conn.close()
+
+
+def test_insert_papers_bulk():
+    """Test inserting many papers in one transaction."""
+    conn = get_database_connection(':memory:')
+    db = PaperDatabase(conn)
+
+    count = db.insert_papers_bulk([
+        {'paper_id': 'p1', 'file_path': '/path/p1.pdf', 'title': 'Urban Food',
+         'authors': ['Smith'], 'doi': '10.1000/bulk1'},
+        {'paper_id': 'p2', 'file_path': '/path/p2.pdf', 'title': 'Rural Farms',
+         'authors': ['Jones'], 'doi': '10.1000/bulk2'},
+    ])
+
+    assert count == 2
+    assert json.loads(db.get_paper('p2')['authors_json']) == ['Jones']
+    assert len(db.search_papers('urban')) == 1
+    conn.close()
+
+
+def test_insert_sections_bulk():
+    """Test inserting many sections with word counts."""
+    conn = get_database_connection(':memory:')
+    db = PaperDatabase(conn)
+    db.insert_paper({'paper_id': 'p1', 'file_path': '/path/p1.pdf', 'title': 'Test'})
+
+    count = db.insert_sections_bulk([
+        {'paper_id': 'p1', 'section_name': 'abstract', 'content': 'Short abstract text'},
+        {'paper_id': 'p1', 'section_name': 'methods', 'content': 'Survey'},
+    ])
+
+    assert count == 2
+    word_counts = dict(conn.execute("SELECT section_name, word_count FROM sections"))
+    assert word_counts == {'abstract': 3, 'methods': 1}
+    conn.close()
+
+
+def test_add_to_existing_collection():
+    """Test adding a second paper reuses the existing collection."""
+    conn = get_database_connection(':memory:')
+    db = PaperDatabase(conn)
+
+    db.insert_papers_bulk([
+        {'paper_id': 'p1', 'file_path': '/path/p1.pdf', 'title': 'First', 'doi': '10.1000/c1'},
+        {'paper_id': 'p2', 'file_path': '/path/p2.pdf', 'title': 'Second', 'doi': '10.1000/c2'},
+    ])
+
+    db.add_to_collection('p1', 'food_systems')
+    db.add_to_collection('p2', 'food_systems')
+    db.add_to_collection('p2', 'food_systems')
+
+    papers = db.get_papers_in_collection('food_systems')
+    assert sorted(p.paper_id for p in papers) == ['p1', 'p2']
+    assert conn.execute("SELECT COUNT(*) FROM collections").fetchone()[0] == 1
+    conn.close()
+
+
+def test_search_papers_ranked_by_relevance():
+    """Test search results come back in BM25 order."""
+    conn = get_database_connection(':memory:')
+    db = PaperDatabase(conn)
+
+    db.insert_papers_bulk([
+        {'paper_id': 'weak', 'file_path': '/path/weak.pdf', 'title': 'Rural Health',
+         'abstract': 'Mentions urban once among many other words here.', 'doi': '10.1000/r1'},
+        {'paper_id': 'strong', 'file_path': '/path/strong.pdf', 'title': 'Urban Food',
+         'abstract': 'Urban urban food deserts.', 'doi': '10.1000/r2'},
+    ])
+
+    results = db.search_papers('urban', limit=10)
+
+    assert [paper.paper_id for paper in results] == ['strong', 'weak']
+    assert db.search_papers('urban', limit=1)[0].paper_id == 'strong'
+    conn.close()
+
+
+def test_search_papers_unranked_returns_same_matches():
+    """Test unranked search finds the same papers as ranked search."""
+    conn = get_database_connection(':memory:')
+    db = PaperDatabase(conn)
+
+    db.insert_papers_bulk([
+        {'paper_id': 'weak', 'file_path': '/path/weak.pdf', 'title': 'Rural Health',
+         'abstract': 'Mentions urban once among many other words here.', 'doi': '10.1000/u1'},
+        {'paper_id': 'strong', 'file_path': '/path/strong.pdf', 'title': 'Urban Food',
+         'abstract': 'Urban urban food deserts.', 'doi': '10.1000/u2'},
+        {'paper_id': 'other', 'file_path': '/path/other.pdf', 'title': 'Rural Agriculture',
+         'abstract': 'Study of rural farming practices.', 'doi': '10.1000/u3'},
+    ])
+
+    ranked = db.search_papers('urban', limit=10)
+    unranked = db.search_papers('urban', limit=10, rank=False)
+
+    assert sorted(p.paper_id for p in unranked) == sorted(p.paper_id for p in ranked)
+    assert len(db.search_papers('urban', limit=1, rank=False)) == 1
+    conn.close()
+
+
+def test_search_papers_cold_reopen_uses_stored_index(tmp_path):
+    """Test a fresh connection searches the persisted FTS index as-is."""
+    db_path = str(tmp_path / 'papers.db')
+
+    conn = get_database_connection(db_path)
+    PaperDatabase(conn).insert_papers_bulk([
+        {'paper_id': 'p1', 'file_path': '/path/p1.pdf', 'title': 'Food Environment Framework',
+         'abstract': 'Concepts for food environment research.', 'doi': '10.1000/c1'},
+        {'paper_id': 'p2', 'file_path': '/path/p2.pdf', 'title': 'Rural Agriculture',
+         'abstract': 'Study of rural farming practices.', 'doi': '10.1000/c2'},
+    ])
+    conn.close()
+
+    # Reopening reruns the IF NOT EXISTS schema; the index must not be rebuilt
+    conn = get_database_connection(db_path)
+    db = PaperDatabase(conn)
+
+    assert conn.execute("SELECT COUNT(*) FROM papers_fts").fetchone()[0] == 2
+    assert [paper.paper_id for paper in db.search_papers('food environment', limit=10)] == ['p1']
+
+    # Triggers keep the index in sync after the reopen
+    conn.execute("UPDATE papers SET title = 'Urban Food Systems' WHERE paper_id = 'p2'")
+    conn.execute("DELETE FROM papers WHERE paper_id = 'p1'")
+    conn.commit()
+
+    assert [paper.paper_id for paper in db.search_papers('food', limit=10)] == ['p2']
+    conn.close()
+
+
+def test_word_count_matches_split_for_long_sections():
+    """Test the streaming word count agrees with str.split()."""
+    from database.queries import WORD_COUNT_SPLIT_MAX, _word_count
+
+    content = 'Food  deserts\tand\nhealth   outcomes  in cities. ' * 2000
+
+    assert len(content) > WORD_COUNT_SPLIT_MAX
+    assert _word_count(content) == len(content.split())
+    assert _word_count('  ') == 0
@@ -45,3 +45,31 @@ def test_fts_table_exists():
     result = cursor.fetchone()
     assert result is not None
     conn.close()
+
+
+def test_shared_memory_database_across_connections():
+    """Test connections to a shared in-memory URI see the same data."""
+    uri = 'file:test_shared_schema?mode=memory&cache=shared'
+    first = get_database_connection(uri)
+    first.execute(
+        "INSERT INTO papers (paper_id, file_path, title) VALUES (?, ?, ?)",
+        ('shared_001', '/path/to/paper.pdf', 'Shared Paper')
+    )
+    first.commit()
+
+    second = get_database_connection(uri)
+    row = second.execute(
+        "SELECT title FROM papers WHERE paper_id = 'shared_001'"
+    ).fetchone()
+
+    assert row['title'] == 'Shared Paper'
+    second.close()
+    first.close()
+
+
+def test_connection_accepts_path_objects(tmp_path):
+    """Test a pathlib.Path works as db_path."""
+    conn = get_database_connection(tmp_path / 'papers.db')
+
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == 'wal'
+    conn.close()
@@ -17,3 +17,127 @@ def test_parse_returns_document_object():
     assert 'text' in doc
     assert 'pages' in doc
     assert 'page_count' in doc
+
+
+def test_parse_text_matches_plain_extraction(tmp_path):
+    """Test page text from either extraction pass matches PyMuPDF plain text."""
+    import fitz
+
+    pdf_path = str(tmp_path / 'sample.pdf')
+    pdf = fitz.open()
+    for page_num in range(2):
+        page = pdf.new_page()
+        page.insert_text((72, 72), f"Page {page_num} heading\nSecond line", fontsize=14)
+        page.insert_text((72, 300), "Body paragraph text", fontsize=10)
+    pdf.save(pdf_path)
+    pdf.close()
+
+    reference = fitz.open(pdf_path)
+    expected = [page.get_text() for page in reference]
+    reference.close()
+
+    text_only = PDFParser().parse(pdf_path)
+    assert [page['text'] for page in text_only['pages']] == expected
+    assert all(page['blocks'] is None for page in text_only['pages'])
+
+    for font_info in (False, True):
+        document = PDFParser(font_info=font_info).parse(pdf_path, extract_blocks=True)
+
+        assert document['page_count'] == 2
+        assert [page['text'] for page in document['pages']] == expected
+
+    assert document['pages'][0]['blocks'][0]['font_size'] == 14
+
+
+def test_parse_blocks_without_font_info(tmp_path):
+    """Test default parsing returns one block per MuPDF text block."""
+    import fitz
+
+    pdf_path = str(tmp_path / 'blocks.pdf')
+    pdf = fitz.open()
+    page = pdf.new_page()
+    page.insert_text((72, 72), "Heading\nSecond line", fontsize=14)
+    page.insert_text((72, 300), "Body paragraph text", fontsize=10)
+    pdf.save(pdf_path)
+    pdf.close()
+
+    blocks = PDFParser().parse(pdf_path, extract_blocks=True)['pages'][0]['blocks']
+
+    assert [block['text'] for block in blocks] == [
+        "Heading\nSecond line\n",
+        "Body paragraph text\n"
+    ]
+    assert len(blocks[0]['bbox']) == 4
+    assert 'font_size' not in blocks[0]
+
+
+def test_parallel_parse_matches_sequential(tmp_path):
+    """Test multi-process parsing returns the same pages in order."""
+    import fitz
+
+    pdf_path = str(tmp_path / 'multipage.pdf')
+    pdf = fitz.open()
+    for page_num in range(5):
+        pdf.new_page().insert_text((72, 72), f"Page number {page_num}")
+    pdf.save(pdf_path)
+    pdf.close()
+
+    sequential = PDFParser(max_workers=1).parse(pdf_path, extract_blocks=True)
+    parallel = PDFParser(max_workers=2, parallel_min_pages=2).parse(
+        pdf_path,
+        extract_blocks=True
+    )
+
+    assert parallel == sequential
+    assert [page['page_num'] for page in parallel['pages']] == [1, 2, 3, 4, 5]
+
+
+def test_iter_pages_matches_parse(tmp_path):
+    """Test streamed pages equal the pages returned by parse."""
+    import fitz
+
+    pdf_path = str(tmp_path / 'stream.pdf')
+    pdf = fitz.open()
+    for page_num in range(3):
+        pdf.new_page().insert_text((72, 72), f"Streamed page {page_num}")
+    pdf.save(pdf_path)
+    pdf.close()
+
+    parser = PDFParser(max_workers=1)
+    pages = parser.iter_pages(pdf_path, extract_blocks=True)
+
+    assert next(pages)['page_num'] == 1
+    assert [page['page_num'] for page in pages] == [2, 3]
+    assert list(parser.iter_pages(pdf_path)) == parser.parse(pdf_path)['pages']
+
+
+def test_parse_closes_document_when_page_parsing_fails(tmp_path, monkeypatch):
+    """Test parse closes the PDF even if a page fails to parse."""
+    import fitz
+    import pytest
+
+    pdf_path = str(tmp_path / 'sample.pdf')
+    pdf = fitz.open()
+    pdf.new_page()
+    pdf.save(pdf_path)
+    pdf.close()
+
+    opened = []
+    real_open = fitz.open
+
+    def tracking_open(*args, **kwargs):
+        doc = real_open(*args, **kwargs)
+        opened.append(doc)
+        return doc
+
+    def failing_parse_page(self, page, page_num, extract_blocks):
+        raise RuntimeError("broken page")
+
+    monkeypatch.setattr(fitz, 'open', tracking_open)
+    monkeypatch.setattr(PDFParser, '_parse_page', failing_parse_page)
+
+    with pytest.raises(RuntimeError):
+        PDFParser(max_workers=1).parse(pdf_path)
+
+    assert len(opened) == 1
+    assert opened[0].is_closed
@@ -3,30 +3,24 @@ Integration test for processing Turner et al. 2018 paper.
 
 This test uses the actual PDF file to verify the complete processing pipeline.
 """
-import os
+import logging
+import stat
 import sys
 import pytest
-from pathlib import Path
 
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+logger = logging.getLogger(__name__)
 
-from pipeline import PaperReader
+# process_paper statuses that mean the paper was stored
+SUCCESS_STATUSES = {'success', 'stored', 'indexed'}
 
 
-TURNER_PDF_PATH = "/Users/emersonrburke/Desktop/thesis-research-hub/1_literature/Turner et al. - 2018 - Concepts and critical perspectives for food environment research A global framework with implicatio.pdf"
-
-
-def test_turner_paper_exists():
+def test_turner_paper_exists(turner_pdf_stat):
     """Verify the Turner PDF file exists."""
-    if not os.path.exists(TURNER_PDF_PATH):
-        pytest.skip(f"Turner PDF not available at: {TURNER_PDF_PATH}")
+    assert turner_pdf_stat is not None, "Turner PDF file should exist"
+    assert stat.S_ISREG(turner_pdf_stat.st_mode), "Path should point to a file"
 
-    assert os.path.exists(TURNER_PDF_PATH), "Turner PDF file should exist"
-    assert os.path.isfile(TURNER_PDF_PATH), "Path should point to a file"
 
-
-def test_process_turner_paper():
+def test_process_turner_paper(turner_reader):
     """
     Integration test: Process Turner et al. 2018 paper end-to-end.
 
@@ -37,58 +31,36 @@ def test_process_turner_paper():
     - Database storage
     - Full-text search
     """
-    # Skip if file doesn't exist
-    if not os.path.exists(TURNER_PDF_PATH):
-        pytest.skip(f"Turner PDF not available at: {TURNER_PDF_PATH}")
-
-    # Initialize reader with in-memory database
-    reader = PaperReader(db_path=':memory:', use_ml=False)
-
-    print(f"\nProcessing Turner paper from: {TURNER_PDF_PATH}")
-
-    # Process paper
-    try:
-        result = reader.process_paper(
-            pdf_path=TURNER_PDF_PATH,
-            collection='food_environment',
-            overwrite=True
-        )
-    except Exception as e:
-        pytest.fail(f"Failed to process Turner paper: {e}")
+    # Paper is processed once per session by the turner_reader fixture
+    reader, result = turner_reader
 
     # Verify processing succeeded
     assert result is not None, "Result should not be None"
-    assert 'status' in result, "Result should have status"
-
-    # The exact status depends on implementation, but it should not be an error
-    print(f"Processing status: {result.get('status')}")
+    logger.debug(f"Processing status: {result.get('status')}")
+    assert result.get('status') in SUCCESS_STATUSES, \
+        f"Processing should succeed, got status: {result.get('status')}"
 
     # Try to verify the paper was stored (if applicable)
     if hasattr(reader, 'db') and hasattr(reader.db, 'search_papers'):
         # Search for "food environment"
         try:
-            search_results = reader.db.search_papers('food environment', limit=10)
-            print(f"Found {len(search_results)} papers matching 'food environment'")
+            # Only the match count matters here, so skip BM25 ranking
+            search_results = reader.db.search_papers('food environment', limit=10, rank=False)
+            logger.debug(f"Found {len(search_results)} papers matching 'food environment'")
 
             # At least the Turner paper should be found
             assert len(search_results) >= 0, "Search should work even if no results"
         except Exception as e:
-            print(f"Search not available or failed: {e}")
+            logger.debug(f"Search not available or failed: {e}")
 
-    print("✓ Turner paper processing test completed successfully")
 
-
-def test_turner_metadata_extraction():
+def test_turner_metadata_extraction(turner_filename):
     """Test that basic metadata can be extracted from Turner paper filename."""
-    if not os.path.exists(TURNER_PDF_PATH):
-        pytest.skip(f"Turner PDF not available")
-
     from preprocessors.metadata_extractor import MetadataExtractor
 
     extractor = MetadataExtractor()
-    filename = os.path.basename(TURNER_PDF_PATH)
 
-    metadata = extractor.extract_from_filename(filename)
+    metadata = extractor.extract_from_filename(turner_filename)
 
     # Verify basic extraction
     assert metadata is not None
@@ -105,21 +77,9 @@ def test_turner_metadata_extraction():
     if metadata.get('year'):
         assert metadata['year'] == 2018, f"Should extract year 2018, got: {metadata['year']}"
 
-    print(f"Extracted metadata: {metadata}")
-    print("✓ Metadata extraction test passed")
+    logger.debug(f"Extracted metadata: {metadata}")
 
 
 if __name__ == '__main__':
-    # Run tests directly
-    print("Running Turner paper integration tests...")
-    print("-" * 60)
-
-    test_turner_paper_exists()
-    print("✓ Turner paper file exists")
-
-    test_turner_metadata_extraction()
-
-    test_process_turner_paper()
-
-    print("-" * 60)
-    print("All integration tests passed!")
+    # Run through pytest so the session fixtures apply
+    sys.exit(pytest.main([__file__, '-v']))
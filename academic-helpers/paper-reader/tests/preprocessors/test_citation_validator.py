@@ -0,0 +1,306 @@
+import asyncio
+import importlib.util
+import json
+import logging
+import sys
+import threading
+import time
+import types
+from pathlib import Path
+
+import pytest
+
+
+MODULE_PATH = Path(__file__).parent.parent.parent / 'preprocessors' / 'citation_validator.py'
+
+
+class StubConfig:
+    """Just the settings CitationValidator reads."""
+    CROSSREF_API_BASE = 'https://api.crossref.org'
+    DUPLICATE_TITLE_THRESHOLD = 0.9
+
+    def get_crossref_headers(self):
+        return {'User-Agent': 'paper-reader-tests'}
+
+
+def _stub_modules():
+    """Stand-ins for academic_helpers.paper_reader config/utils."""
+    config = types.ModuleType('academic_helpers.paper_reader.config')
+    config.get_config = StubConfig
+
+    utils = types.ModuleType('academic_helpers.paper_reader.utils')
+    utils.get_logger = logging.getLogger
+    utils.CrossRefAPIError = type('CrossRefAPIError', (Exception,), {})
+    utils.DuplicatePaperError = type('DuplicatePaperError', (Exception,), {})
+    utils.validate_doi = lambda doi: doi.startswith('10.')
+    utils.normalize_doi = lambda doi: doi.strip().lower().replace('https://doi.org/', '')
+
+    return {
+        'academic_helpers': types.ModuleType('academic_helpers'),
+        'academic_helpers.paper_reader': types.ModuleType('academic_helpers.paper_reader'),
+        'academic_helpers.paper_reader.config': config,
+        'academic_helpers.paper_reader.utils': utils,
+    }
+
+
+@pytest.fixture(scope="module")
+def cv():
+    """citation_validator loaded against stub config/utils modules."""
+    with pytest.MonkeyPatch.context() as mp:
+        for name, module in _stub_modules().items():
+            mp.setitem(sys.modules, name, module)
+
+        spec = importlib.util.spec_from_file_location('_citation_validator_under_test', MODULE_PATH)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        yield module
+
+
+class FakeResponse:
+    """Minimal requests.Response for CrossRef payloads."""
+
+    def __init__(self, payload, status_code=200):
+        self.status_code = status_code
+        self._payload = payload
+        self.content = json.dumps(payload).encode()
+
+    def json(self):
+        return self._payload
+
+    def raise_for_status(self):
+        pass
+
+
+class FakeSession:
+    """Records CrossRef GETs and answers DOI lookups with a canonical title."""
+
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.calls = []
+        self.request_headers = []
+        self._lock = threading.Lock()
+
+    def get(self, url, params=None, headers=None, timeout=None):
+        with self._lock:
+            self.calls.append((time.monotonic(), url))
+            self.request_headers.append(headers)
+        if self.delay:
+            time.sleep(self.delay)
+        doi = url.rsplit('/works/', 1)[-1]
+        return FakeResponse({'message': {'title': [f'Canonical {doi}'], 'DOI': doi}})
+
+
+@pytest.fixture
+def validator(cv):
+    """CitationValidator with a fake CrossRef session."""
+    validator = cv.CitationValidator()
+    validator._crossref_session = FakeSession()
+    return validator
+
+
+def test_blocking_still_compares_papers_missing_author_or_year(validator):
+    """Test papers without a (surname, year) block are still title-matched."""
+    existing = [{
+        'paper_id': 'p1',
+        'title': 'Food environments and dietary outcomes',
+        'authors': ['Turner, Christopher'],
+        'year': 2018,
+    }]
+
+    # No authors or year: no block, so it must be compared against p1
+    match = validator.check_duplicate(
+        {'title': 'Food Environments and Dietary Outcomes.'},
+        validator.build_index(existing)
+    )
+
+    assert match is not None
+    assert match[0] == 'p1'
+
+
+def test_different_authors_or_years_are_not_title_matched(validator):
+    """Test fully blocked papers in different blocks are never compared."""
+    existing = [{'paper_id': 'p1', 'title': 'Urban food deserts', 'authors': ['Smith, J'], 'year': 2019}]
+
+    match = validator.check_duplicate(
+        {'title': 'Urban food deserts', 'authors': ['Jones, A'], 'year': 2019},
+        validator.build_index(existing)
+    )
+
+    assert match is None
+
+
+def test_papers_with_different_dois_skip_title_scoring(validator, monkeypatch):
+    """Test two papers with distinct DOIs are never title-scored."""
+    scored = []
+    real_similarity = validator._title_similarity
+
+    def counting_similarity(norm1, norm2):
+        scored.append((norm1, norm2))
+        return real_similarity(norm1, norm2)
+
+    monkeypatch.setattr(validator, '_title_similarity', counting_similarity)
+    existing = [{'paper_id': 'p1', 'title': 'Urban food deserts', 'doi': '10.1000/a'}]
+
+    match = validator.check_duplicate(
+        {'title': 'Urban food deserts', 'doi': '10.1000/b'},
+        validator.build_index(existing)
+    )
+
+    assert match is None
+    assert scored == []
+
+
+def test_duplicate_found_by_normalized_doi(validator):
+    """Test DOI matches ignore case and the doi.org prefix."""
+    index = validator.build_index([
+        {'paper_id': 'p1', 'title': 'First', 'doi': '10.1000/ABC'},
+        {'paper_id': 'p2', 'title': 'Second', 'doi': '10.1000/abc'},
+    ])
+
+    match = validator.check_duplicate({'title': 'Other', 'doi': 'https://doi.org/10.1000/abc'}, index)
+
+    assert match == ('p1', 1.0)
+
+
+def test_check_duplicate_list_matches_index_and_batch(validator):
+    """Test the deprecated list form, the index form and the batch agree."""
+    existing = [
+        {'paper_id': 'p1', 'title': 'Food deserts and obesity in urban areas',
+         'authors': ['Smith, J'], 'year': 2019},
+        {'paper_id': 'p2', 'title': 'Rural agriculture practices', 'doi': '10.1000/r'},
+        {'paper_id': 'p3', 'title': 'Neighbourhood food access', 'authors': ['Lee K'], 'year': 2020},
+        {'paper_id': 'p4', 'title': ''},
+    ]
+    new_papers = [
+        {'title': 'Food deserts and obesity in urban area', 'authors': ['Smith, J'], 'year': 2019},
+        {'title': 'Food deserts and obesity in urban area', 'authors': ['Doe, A'], 'year': 2019},
+        {'title': 'Something else', 'doi': '10.1000/R'},
+        {'title': 'Neighborhood food access'},
+        {'title': 'Unrelated title entirely'},
+        {},
+    ]
+    index = validator.build_index(existing)
+
+    with pytest.warns(DeprecationWarning):
+        from_list = [validator.check_duplicate(paper, existing) for paper in new_papers]
+    from_index = [validator.check_duplicate(paper, index) for paper in new_papers]
+
+    assert from_list == from_index
+    assert [m and m[0] for m in from_index] == ['p1', None, 'p2', 'p3', None, None]
+    assert validator.check_duplicate_batch(new_papers, index) == from_index
+
+
+def test_length_upper_bound_never_below_similarity(cv):
+    """Test the length prefilter never rejects a pair that could match."""
+    pairs = [
+        ('food deserts', 'food deserts and health'),
+        ('a', 'abcdefgh'),
+        ('urban food access', 'rural food access'),
+        ('', 'anything'),
+    ]
+
+    for norm1, norm2 in pairs:
+        bound = cv._similarity_upper_bound(len(norm1), len(norm2))
+        assert bound >= cv._normalized_title_similarity(norm1, norm2)
+
+
+def test_validate_preserves_order_and_fans_out_duplicates(validator):
+    """Test validate keeps input order and queries each distinct reference once."""
+    references = [
+        {'title': 'A', 'doi': '10.1000/a'},
+        {'title': 'B', 'doi': '10.1000/b'},
+        {'title': 'a.', 'doi': '10.1000/A'},
+        {'title': ''},
+    ]
+
+    results = validator.validate(references, max_workers=4)
+
+    assert [r['original'] for r in results] == references
+    assert [r['validated'].get('title') for r in results] == [
+        'Canonical 10.1000/a', 'Canonical 10.1000/b', 'Canonical 10.1000/a', '',
+    ]
+    assert len(validator._crossref_session.calls) == 2
+
+
+def test_validate_async_matches_validate(validator):
+    """Test the asyncio path returns the same results in the same order."""
+    references = [{'doi': f'10.1000/{i}'} for i in range(5)]
+
+    expected = validator.validate(references)
+    results = asyncio.run(validator.validate_async(references, max_concurrency=3))
+
+    assert results == expected
+
+
+def test_rate_limiter_spaces_threaded_requests(validator):
+    """Test concurrent validation keeps request starts apart."""
+    references = [{'doi': f'10.1000/{i}'} for i in range(12)]
+
+    validator.validate(references, max_workers=6)
+
+    starts = sorted(start for start, _ in validator._crossref_session.calls)
+    gaps = [b - a for a, b in zip(starts, starts[1:])]
+    # Small tolerance for clock granularity
+    assert min(gaps) >= validator._min_request_interval * 0.9
+
+
+def test_serial_validation_skips_limiter_after_slow_requests(validator, monkeypatch):
+    """Test serial validation skips the wait once a call took the interval."""
+    validator._crossref_session = FakeSession(delay=validator._min_request_interval * 1.5)
+    waits = []
+    monkeypatch.setattr(validator, '_apply_rate_limit', lambda: waits.append(1))
+
+    validator.validate([{'doi': f'10.1000/{i}'} for i in range(4)], max_workers=1)
+
+    # Only the first request, with no call timed yet, goes through the limiter
+    assert len(waits) == 1
+
+
+def test_validate_does_not_group_references_without_doi_or_title(validator, monkeypatch):
+    """Test references with neither DOI nor title are validated one by one."""
+    seen = []
+
+    def fake_single(reference):
+        seen.append(reference)
+        return {'original': reference, 'validated': reference,
+                'confidence': f"LOW-{reference['year']}", 'validation_method': 'none'}
+
+    monkeypatch.setattr(validator, '_validate_single_citation', fake_single)
+    references = [{'authors': ['Smith'], 'year': 2019}, {'authors': ['Jones'], 'year': 2020}]
+
+    results = validator.validate(references)
+
+    assert seen == references
+    assert [r['confidence'] for r in results] == ['LOW-2019', 'LOW-2020']
+    assert [r['validated'] for r in results] == references
+
+
+def test_validate_is_serial_by_default(validator, monkeypatch):
+    """Test validate only uses worker threads when asked to."""
+    threads = set()
+
+    def fake_single(reference):
+        threads.add(threading.get_ident())
+        return {'original': reference, 'validated': reference,
+                'confidence': 'LOW', 'validation_method': 'none'}
+
+    monkeypatch.setattr(validator, '_validate_single_citation', fake_single)
+
+    validator.validate([{'title': f'Paper {i}'} for i in range(8)])
+
+    assert len(threads) == 1
+
+
+def test_validators_sharing_a_session_keep_their_own_headers(cv, monkeypatch):
+    """Test a validator's config headers never leak onto the shared session."""
+    session = FakeSession()
+    monkeypatch.setattr(cv, '_get_crossref_session', lambda cache_path: session)
+
+    first = cv.CitationValidator()
+    monkeypatch.setattr(StubConfig, 'get_crossref_headers', lambda self: {'User-Agent': 'other'})
+    second = cv.CitationValidator()
+
+    first.validate([{'doi': '10.1000/a'}])
+    second.validate([{'doi': '10.1000/b'}])
+
+    assert session.request_headers == [{'User-Agent': 'paper-reader-tests'}, {'User-Agent': 'other'}]
@@ -1,26 +1,53 @@
 import os
+import pytest
 from preprocessors.metadata_extractor import MetadataExtractor
 
 
-def test_extract_from_filename():
-    """Test metadata extraction from filename pattern."""
-    extractor = MetadataExtractor()
+@pytest.fixture(scope="module")
+def extractor():
+    """One MetadataExtractor shared by the module's tests."""
+    return MetadataExtractor()
+
 
-    # Test filename pattern: Author_Year_Title.pdf
-    metadata = extractor.extract_from_filename(
-        "Turner_2018_Food_Environment_Framework.pdf"
-    )
+@pytest.mark.parametrize("filename,expected_author,expected_year,expected_title", [
+    # Author_Year_Title.pdf
+    ("Turner_2018_Food_Environment_Framework.pdf", "Turner", 2018, "Food Environment Framework"),
+    # Author et al Year Title.pdf
+    ("Smith et al 2020 Urban Food Deserts.pdf", "Smith", 2020, "Urban Food Deserts"),
+    ("Turner et al. - 2018 - Concepts and critical perspectives.pdf",
+     "Turner", 2018, "Concepts and critical perspectives"),
+    # Year Author Title.pdf: no text before the year to take an author from
+    ("2019 Lee Food Access.pdf", None, 2019, "Lee Food Access"),
+])
+def test_extract_from_filename(extractor, filename, expected_author, expected_year, expected_title):
+    """Test metadata extraction from filename pattern."""
+    metadata = extractor.extract_from_filename(filename)
 
-    assert 'Turner' in metadata['authors']
-    assert metadata['year'] == 2018
-    assert 'Food Environment Framework' in metadata['title']
+    if expected_author:
+        assert expected_author in metadata['authors']
+    else:
+        assert metadata['authors'] == []
+    assert metadata['year'] == expected_year
+    assert expected_title in metadata['title']
     assert metadata['extraction_source'] == 'filename'
 
 
-def test_extract_metadata_returns_structure():
-    """Test that extract returns required metadata structure."""
-    extractor = MetadataExtractor()
+def test_extract_batch_matches_single_extraction(extractor):
+    """Test batch extraction returns per-filename metadata in order."""
+    filenames = [
+        "Turner_2018_Food_Environment_Framework.pdf",
+        "Smith et al 2020 Urban Food Deserts.pdf",
+        "untitled_scan.pdf",
+    ]
+
+    batch = extractor.extract_batch(filenames)
+
+    assert batch == [extractor.extract_from_filename(f) for f in filenames]
+    assert [m['year'] for m in batch] == [2018, 2020, None]
 
+
+def test_extract_metadata_returns_structure(extractor):
+    """Test that extract returns required metadata structure."""
     # Mock extraction (we'll test with real PDF later)
     metadata = extractor._create_empty_metadata()
 
@@ -29,3 +56,14 @@ def test_extract_metadata_returns_structure():
 
     for key in required_keys:
         assert key in metadata
+
+
+def test_empty_metadata_lists_are_not_shared(extractor):
+    """Test each empty metadata dict gets its own list fields."""
+    first = extractor._create_empty_metadata()
+    first['authors'].append('Turner')
+    first['keywords'].append('food')
+    second = extractor._create_empty_metadata()
+
+    assert second['authors'] == []
+    assert second['keywords'] == []